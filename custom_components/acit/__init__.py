@@ -2,20 +2,31 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
-from .coordinator import ACITThermACECCoordinator
+from .coordinator import ACITThermACECCoordinator, async_get_device_config_store
+from .device_index import async_get_device_index
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.CLIMATE, Platform.UPDATE]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the ACIT services, shared by every config entry."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the ACIT ThermACEC integration from a config entry."""
@@ -34,7 +45,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register the device
     device_info = coordinator.device_info
     device_registry = dr.async_get(hass)
-    device_registry.async_get_or_create(
+    device = device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
         identifiers={(DOMAIN, device_info.get("mac_address", entry.entry_id))},
         manufacturer=device_info.get("manufacturer", "ACIT"),
@@ -43,38 +54,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sw_version=device_info.get("version", "Unavailable"),
     )
 
+    # Make the device reachable by the services
+    entry.async_on_unload(
+        async_get_device_index(hass).async_add(coordinator, device.id)
+    )
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
-    async def async_check_update(call: ServiceCall) -> None:
-        """Service to manually check for OTA updates."""
-        device_id = call.data.get("device_id")
-
-        if not device_id:
-            _LOGGER.error("No device_id provided for check_update service")
-            return
-
-        # Get the device registry to find the entry_id
-        device_registry = dr.async_get(hass)
-        device_entry = device_registry.async_get(device_id)
-
-        if not device_entry:
-            _LOGGER.error("Device not found: %s", device_id)
-            return
-
-        # Find the corresponding coordinator
-        for entry_id in device_entry.config_entries:
-            coordinator = hass.data[DOMAIN].get(entry_id)
-            if coordinator and isinstance(coordinator, ACITThermACECCoordinator):
-                await coordinator.async_check_ota_update()
-                await coordinator.async_request_refresh()
-                _LOGGER.info("OTA update check triggered for %s", device_id)
-                return
-
-        _LOGGER.error("Coordinator not found for device: %s", device_id)
-
-    hass.services.async_register(DOMAIN, "check_update", async_check_update)
+    # Reload when options change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     _LOGGER.info("ACIT ThermACEC integration set up successfully")
     return True
@@ -98,8 +87,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached device configuration of a deleted config entry."""
+    await async_get_device_config_store(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload a config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
 
@@ -13,10 +13,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MAX_TEMP, MIN_TEMP, TEMP_STEP
-from .coordinator import ACITThermACECCoordinator
+from .coordinator import STATUS_FIELDS, ACITThermACECCoordinator
+from .entity import ACITEntity
 from .models import ACITFeature, get_supported_features
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,14 +40,16 @@ async def async_setup_entry(
         ])
     else:
         _LOGGER.debug(
-            f"Climate entity not created for {coordinator.device_info.get('model')} "
-            f"(temperature feature not supported)"
+            "Climate entity not created for %s (temperature feature not supported)",
+            coordinator.device_info.get("model"),
         )
 
 
-class ACITThermACECClimate(CoordinatorEntity, ClimateEntity):
+class ACITThermACECClimate(ACITEntity, ClimateEntity):
     """Climate entity for ACIT ThermACEC."""
 
+    _watched_keys = frozenset({*STATUS_FIELDS, "available"})
+    _status_fields = frozenset(STATUS_FIELDS)
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
     _attr_hvac_modes = [HVACMode.HEAT]  # Simplified mode for v2.0
@@ -84,37 +86,37 @@ class ACITThermACECClimate(CoordinatorEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self.coordinator.data.get("temperature")
+        return self.coordinator.data.temperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        return self.coordinator.data.get("target_temperature")
+        return self.coordinator.data.target_temperature
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current HVAC mode."""
         # For v2.0, simplified mode based on heater_level
-        heater_level = self.coordinator.data.get("heater_level", 0)
+        heater_level = self.coordinator.data.heater_level or 0
         return HVACMode.HEAT if heater_level > 0 else HVACMode.HEAT
 
     @property
     def available(self) -> bool:
         """Return whether the entity is available."""
-        return self.coordinator.data.get("available", False)
+        return self.coordinator.data.available
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set the target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
 
-        _LOGGER.debug(f"Setting target temperature: {temperature}°C")
+        _LOGGER.debug("Setting target temperature: %s°C", temperature)
         await self.coordinator.async_set_target_temperature(temperature)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the HVAC mode."""
         # For v2.0, the mode is always HEAT (automatically managed by the device)
-        _LOGGER.debug(f"HVAC mode: {hvac_mode} (automatically managed by the device)")
+        _LOGGER.debug("HVAC mode: %s (automatically managed by the device)", hvac_mode)
 
     @property
     def icon(self) -> str:
@@ -125,6 +127,6 @@ class ACITThermACECClimate(CoordinatorEntity, ClimateEntity):
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         return {
-            "heater_level": self.coordinator.data.get("heater_level"),
-            "fan_speed": self.coordinator.data.get("fan_speed"),
+            "heater_level": self.coordinator.data.heater_level,
+            "fan_speed": self.coordinator.data.fan_speed,
         }
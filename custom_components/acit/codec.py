@@ -0,0 +1,64 @@
+"""JSON codec for ACIT JSON-RPC traffic."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+# Raised by decode() on malformed input (orjson.JSONDecodeError and
+# json.JSONDecodeError both derive from it)
+DecodeError = ValueError
+
+# Pre-serialized requests without params, split around the id:
+# method -> (prefix, suffix)
+_TEMPLATES: dict[str, tuple[bytes, bytes]] = {}
+
+if orjson is not None:
+
+    def encode(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        return orjson.dumps(obj)
+
+    def decode(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+
+    def encode(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def decode(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+
+def encode_request(request_id: int, method: str, params: dict[str, Any] | None) -> bytes:
+    """Serialize a JSON-RPC 2.0 request.
+
+    Requests without params only differ by their id, so they are built from
+    a per-method template instead of going through the encoder.
+    """
+    if params:
+        return encode(
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        )
+
+    if (template := _TEMPLATES.get(method)) is None:
+        template = _TEMPLATES[method] = (
+            b'{"jsonrpc":"2.0","method":' + encode(method) + b',"params":{},"id":',
+            b"}",
+        )
+
+    prefix, suffix = template
+    return b"%s%d%s" % (prefix, request_id, suffix)
+
+
+def encode_batch(requests: list[bytes]) -> bytes:
+    """Join serialized requests into a JSON-RPC 2.0 batch."""
+    return b"[" + b",".join(requests) + b"]"
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from string import hexdigits
 from typing import Any
 
 import aiohttp
@@ -11,19 +12,41 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.components import zeroconf
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
-from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import FlowResult, FlowResultType
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
 from .const import (
+    CONF_COALESCE_WINDOW,
+    CONF_HISTORY_WINDOW,
+    CONF_TRACE_SAMPLE_RATE,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_HISTORY_WINDOW,
     DEFAULT_NAME,
     DEFAULT_PORT,
+    DEFAULT_TRACE_SAMPLE_RATE,
     DOMAIN,
+    MAX_COALESCE_WINDOW,
+    MAX_HISTORY_WINDOW,
+    MDNS_HOSTNAME_PREFIX,
+    MDNS_TXT_MAC,
+    MDNS_TXT_MODEL,
+    MDNS_TXT_VERSION,
     RPC_ENDPOINT,
     RPC_METHOD_GET_CONFIG,
+    RPC_TIMEOUT,
+    SCAN_MAX_HOSTS,
+    SOURCE_SCAN,
 )
+from .device_index import async_get_device_index
+from .onboarding import ScannedDevice, ScanResult, async_scan, parse_hosts
+from .transport import async_get_transport
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_HOSTS = "hosts"
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME, default=DEFAULT_NAME): cv.string,
@@ -32,6 +55,13 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_BULK_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOSTS): TextSelector(TextSelectorConfig(multiline=True)),
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
+    }
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate user input by testing the RPC connection."""
@@ -46,30 +76,33 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         "params": {},
     }
 
+    transport = async_get_transport(hass)
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
+        async with transport.request_slot(host, port):
+            async with transport.session.post(
                 url,
                 json=payload,
-                timeout=aiohttp.ClientTimeout(total=10),
+                timeout=aiohttp.ClientTimeout(total=RPC_TIMEOUT),
             ) as response:
                 if response.status != 200:
                     raise ValueError(f"HTTP error {response.status}")
 
                 result = await response.json()
 
-                if "error" in result:
-                    raise ValueError(f"RPC error: {result['error'].get('message')}")
+        if "error" in result:
+            raise ValueError(f"RPC error: {result['error'].get('message')}")
 
-                config = result.get("result", {})
-                mac_address = config.get("mac_address", "")
-                model = config.get("model", "ThermACEC")
+        config = result.get("result", {})
+        mac_address = config.get("mac_address", "")
+        model = config.get("model", "ThermACEC")
 
-                return {
-                    "title": data[CONF_NAME],
-                    "mac_address": mac_address,
-                    "model": model,
-                }
+        return {
+            "title": data[CONF_NAME],
+            "mac_address": mac_address,
+            "model": model,
+            "version": config.get("version"),
+        }
 
     except asyncio.TimeoutError as err:
         raise ValueError("Connection timeout") from err
@@ -77,6 +110,35 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         raise ValueError(f"Connection error: {err}") from err
 
 
+def _announced_mac(discovery_info: zeroconf.ZeroconfServiceInfo) -> str | None:
+    """Return the MAC address announced in the TXT records or the hostname."""
+    if mac_address := discovery_info.properties.get(MDNS_TXT_MAC):
+        return mac_address
+
+    # acit-thermacec-<MAC>.local.
+    name = discovery_info.hostname.removesuffix(".").removesuffix(".local")
+    if name.startswith(MDNS_HOSTNAME_PREFIX):
+        suffix = name.removeprefix(MDNS_HOSTNAME_PREFIX)
+        if len(suffix) == 12 and all(char in hexdigits for char in suffix):
+            return suffix
+    return None
+
+
+def _scanned_entry_data(device: ScannedDevice) -> dict[str, Any]:
+    """Return the entry data of a device found by a bulk scan."""
+    # Model and end of the MAC address, to tell the devices apart
+    suffix = device.mac_address.replace(":", "").replace("-", "")[-6:].upper()
+    name = f"{device.model} {suffix or device.host}"
+    return {
+        CONF_NAME: name,
+        CONF_HOST: device.host,
+        CONF_PORT: device.port,
+        "device_name": name,
+        "mac_address": device.mac_address,
+        "model": device.model,
+    }
+
+
 class ACITThermaControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the config flow for ACIT ThermaControl."""
 
@@ -85,12 +147,25 @@ class ACITThermaControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered_devices: dict[str, dict[str, Any]] = {}
+        self._discovered_version: str | None = None
+        self._scan_addresses: list[tuple[str, int]] = []
+        self._scan_task: asyncio.Task[ScanResult] | None = None
+        self._scan_result = ScanResult()
+        self._scanned_devices: list[ScannedDevice] = []
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> ACITOptionsFlow:
+        """Return the options flow handler."""
+        return ACITOptionsFlow(config_entry)
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the user-initiated step."""
-        return await self.async_step_manual()
+        return self.async_show_menu(step_id="user", menu_options=["manual", "bulk"])
 
     async def async_step_manual(
         self, user_input: dict[str, Any] | None = None
@@ -102,15 +177,17 @@ class ACITThermaControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 info = await validate_input(self.hass, user_input)
             except ValueError as err:
-                _LOGGER.error(f"Validation error: {err}")
+                _LOGGER.error("Validation error: %s", err)
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error during validation")
                 errors["base"] = "unknown"
             else:
                 # Use MAC address as unique_id
-                mac_address = info.get("mac_address", user_input[CONF_HOST])
-                await self.async_set_unique_id(mac_address)
+                mac_address = info.get("mac_address") or user_input[CONF_HOST]
+                await self.async_set_unique_id(
+                    self._async_unique_id_for_mac(mac_address)
+                )
                 self._abort_if_unique_id_configured()
 
                 # Add device_name to data
@@ -129,41 +206,191 @@ class ACITThermaControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    async def async_step_bulk(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a list of address ranges and hosts for devices."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                addresses = parse_hosts(
+                    user_input[CONF_HOSTS], user_input[CONF_PORT], SCAN_MAX_HOSTS
+                )
+            except ValueError as err:
+                _LOGGER.debug("Invalid host list: %s", err)
+                errors[CONF_HOSTS] = "invalid_hosts"
+            else:
+                if not addresses:
+                    errors[CONF_HOSTS] = "invalid_hosts"
+                elif len(addresses) > SCAN_MAX_HOSTS:
+                    errors[CONF_HOSTS] = "too_many_hosts"
+                else:
+                    self._scan_addresses = addresses
+                    return await self.async_step_bulk_scan()
+
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_BULK_DATA_SCHEMA, user_input
+            ),
+            errors=errors,
+            description_placeholders={"max_hosts": str(SCAN_MAX_HOSTS)},
+        )
+
+    async def async_step_bulk_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Show the progress of the scan, which may take a while on large ranges."""
+        if self._scan_task is None:
+            self._scan_task = self.hass.async_create_task(
+                async_scan(self.hass, self._scan_addresses)
+            )
+        if not self._scan_task.done():
+            return self.async_show_progress(
+                step_id="bulk_scan",
+                progress_action="bulk_scan",
+                description_placeholders={"count": str(len(self._scan_addresses))},
+                progress_task=self._scan_task,
+            )
+
+        self._scan_result = self._scan_task.result()
+        self._scan_task = None
+        return self.async_show_progress_done(next_step_id="bulk_confirm")
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop the scan when the flow is closed."""
+        if self._scan_task is not None:
+            self._scan_task.cancel()
+
+    async def async_step_bulk_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Offer the devices found by the scan not configured yet, and add them."""
+        scan = self._scan_result
+        if user_input is None:
+            configured = self._async_current_ids()
+            self._scanned_devices = [
+                device
+                for device in scan.devices
+                if self._async_unique_id_for_mac(device.mac_address or device.host)
+                not in configured
+            ]
+            if not self._scanned_devices:
+                return self.async_abort(
+                    reason="no_devices_found",
+                    description_placeholders={"scanned": str(scan.scanned)},
+                )
+
+            return self.async_show_form(
+                step_id="bulk_confirm",
+                description_placeholders={
+                    "scanned": str(scan.scanned),
+                    "found": str(len(scan.devices)),
+                    "new": str(len(self._scanned_devices)),
+                    "configured": str(len(scan.devices) - len(self._scanned_devices)),
+                    "unreachable": str(scan.unreachable),
+                },
+            )
+
+        # One flow per device, from a source of its own so that each device
+        # gets its unique id and duplicate checks
+        results = await asyncio.gather(
+            *(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_SCAN},
+                    data=_scanned_entry_data(device),
+                )
+                for device in self._scanned_devices
+            )
+        )
+        added = sum(
+            1 for result in results if result["type"] == FlowResultType.CREATE_ENTRY
+        )
+        _LOGGER.info("Added %d ACIT devices found by scanning", added)
+        return self.async_abort(
+            reason="bulk_added", description_placeholders={"count": str(added)}
+        )
+
+    async def async_step_scan(self, scanned_data: dict[str, Any]) -> FlowResult:
+        """Add a device found by a bulk scan."""
+        await self.async_set_unique_id(
+            self._async_unique_id_for_mac(
+                scanned_data["mac_address"] or scanned_data[CONF_HOST]
+            )
+        )
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=scanned_data[CONF_NAME], data=scanned_data)
+
     async def async_step_zeroconf(
         self, discovery_info: zeroconf.ZeroconfServiceInfo
     ) -> FlowResult:
-        """Handle Zeroconf/mDNS discovery."""
-        _LOGGER.info(f"ACIT device discovered via mDNS: {discovery_info}")
+        """Handle Zeroconf/mDNS discovery.
+
+        Devices announce themselves again after every network blip, so known
+        devices are rejected before any network I/O, by the MAC address of
+        the announcement, or by host when it has none: a new device may take
+        over the address of a configured one. Devices whose TXT records carry
+        their MAC address are never probed; the others are probed with one
+        flow per host, a few at a time.
+        """
+        _LOGGER.debug("ACIT device discovered via mDNS: %s", discovery_info)
 
         host = discovery_info.host
         port = discovery_info.port or DEFAULT_PORT
         hostname = discovery_info.hostname
+        properties = discovery_info.properties
 
         # Extract device name from hostname
         device_name = hostname.replace(".local.", "").replace("_", " ").title()
 
-        # Test connection and retrieve config
-        try:
-            info = await validate_input(
-                self.hass,
-                {
-                    CONF_NAME: device_name,
-                    CONF_HOST: host,
-                    CONF_PORT: port,
-                },
-            )
-        except Exception as err:
-            _LOGGER.error(f"Error validating discovered device: {err}")
-            return self.async_abort(reason="cannot_connect")
+        # Known device: follow its address if it changed
+        if (mac_address := _announced_mac(discovery_info)) is not None:
+            await self.async_set_unique_id(self._async_unique_id_for_mac(mac_address))
+            self._abort_if_unique_id_configured(updates={CONF_HOST: host, CONF_PORT: port})
+        else:
+            self._async_abort_entries_match({CONF_HOST: host})
+
+        # One flow per host
+        self.context[CONF_HOST] = host
+        if self._async_in_progress(
+            include_uninitialized=True, match_context={CONF_HOST: host}
+        ):
+            return self.async_abort(reason="already_in_progress")
+
+        if properties.get(MDNS_TXT_MAC):
+            info = {
+                "mac_address": properties[MDNS_TXT_MAC],
+                "model": properties.get(MDNS_TXT_MODEL, "ThermACEC"),
+                "version": properties.get(MDNS_TXT_VERSION),
+            }
+        else:
+            # Test connection and retrieve config
+            try:
+                async with async_get_transport(self.hass).probe_slot():
+                    info = await validate_input(
+                        self.hass,
+                        {
+                            CONF_NAME: device_name,
+                            CONF_HOST: host,
+                            CONF_PORT: port,
+                        },
+                    )
+            except Exception as err:
+                _LOGGER.debug("Error validating discovered device: %s", err)
+                return self.async_abort(reason="cannot_connect")
 
         # Use MAC address as unique_id
-        mac_address = info.get("mac_address", host)
-        await self.async_set_unique_id(mac_address)
-        self._abort_if_unique_id_configured()
+        mac_address = info.get("mac_address") or host
+        await self.async_set_unique_id(self._async_unique_id_for_mac(mac_address))
+        self._abort_if_unique_id_configured(updates={CONF_HOST: host, CONF_PORT: port})
 
         # Store discovered device information
         self.context["title_placeholders"] = {"name": device_name}
-        self._discovered_devices[mac_address] = {
+        self._discovered_version = info.get("version")
+        self._discovered_devices[self.unique_id] = {
             CONF_NAME: device_name,
             CONF_HOST: host,
             CONF_PORT: port,
@@ -174,6 +401,23 @@ class ACITThermaControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return await self.async_step_discovery_confirm()
 
+    @callback
+    def _async_unique_id_for_mac(self, mac_address: str) -> str:
+        """Return the unique id of the entry of a device, or its MAC address if new.
+
+        Entries use the MAC address as reported by the device, which may be
+        formatted differently in an announcement.
+        """
+        formatted = dr.format_mac(mac_address)
+        coordinator = async_get_device_index(self.hass).async_get_by_mac(formatted)
+        if coordinator is not None and coordinator.entry.unique_id:
+            return coordinator.entry.unique_id
+
+        for entry in self._async_current_entries(include_ignore=True):
+            if entry.unique_id and dr.format_mac(entry.unique_id) == formatted:
+                return entry.unique_id
+        return mac_address
+
     async def async_step_discovery_confirm(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -193,6 +437,52 @@ class ACITThermaControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "name": discovered.get(CONF_NAME, "ACIT ThermACEC"),
                 "host": discovered.get(CONF_HOST, ""),
                 "model": discovered.get("model", "ThermACEC"),
+                "version": self._discovered_version or "-",
             },
         )
 
+
+class ACITOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for an ACIT device."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the device options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_COALESCE_WINDOW,
+                        default=options.get(
+                            CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=MAX_COALESCE_WINDOW)
+                    ),
+                    vol.Optional(
+                        CONF_HISTORY_WINDOW,
+                        default=options.get(
+                            CONF_HISTORY_WINDOW, DEFAULT_HISTORY_WINDOW
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=MAX_HISTORY_WINDOW)
+                    ),
+                    vol.Optional(
+                        CONF_TRACE_SAMPLE_RATE,
+                        default=options.get(
+                            CONF_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SAMPLE_RATE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                }
+            ),
+        )
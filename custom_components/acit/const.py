@@ -12,15 +12,53 @@ DEFAULT_SCAN_INTERVAL: Final = 30
 # mDNS/Zeroconf
 MDNS_SERVICE_TYPE: Final = "_acit._tcp.local."
 MDNS_HOSTNAME_PREFIX: Final = "acit-thermacec-"
+# TXT record keys of the announcement
+MDNS_TXT_MAC: Final = "mac"
+MDNS_TXT_MODEL: Final = "model"
+MDNS_TXT_VERSION: Final = "version"
 
 # HTTP RPC
 RPC_ENDPOINT: Final = "/rpc"
 RPC_TIMEOUT: Final = 10
 
+# Storage (last known device configuration, one store per config entry)
+STORAGE_VERSION: Final = 1
+STORAGE_KEY_DEVICE_CONFIG: Final = "acit.device_config"
+
+# Shared transport (one pooled session for the whole fleet)
+DATA_TRANSPORT: Final = "acit_transport"
+TRANSPORT_MAX_CONCURRENT_REQUESTS: Final = 16
+TRANSPORT_MAX_REQUESTS_PER_HOST: Final = 1
+TRANSPORT_MAX_CONCURRENT_HANDSHAKES: Final = 4
+# Discovered devices probed at once when their announcement lacks TXT records
+TRANSPORT_MAX_CONCURRENT_PROBES: Final = 4
+
+# Bulk onboarding: hosts probed at once, time allowed to connect to a host
+# and to get its configuration (seconds), and most addresses per scan
+SCAN_MAX_WORKERS: Final = 64
+SCAN_CONNECT_TIMEOUT: Final = 1
+SCAN_TIMEOUT: Final = 3
+SCAN_MAX_HOSTS: Final = 1024
+# Source of the flows adding the devices found by a scan, one per device
+SOURCE_SCAN: Final = "scan"
+
 # WebSocket
 WS_ENDPOINT: Final = "/ws"
+# Reconnect backoff (seconds): doubles after each failed attempt, with jitter
 WS_RECONNECT_DELAY: Final = 5
-WS_PING_INTERVAL: Final = 30
+WS_RECONNECT_MAX_DELAY: Final = 300
+# Time a connection must stay open (seconds) before the backoff is reset,
+# so a device dropping sockets right after the handshake is still backed off
+WS_STABLE_CONNECTION: Final = 30
+# Availability timeout (seconds) - a WebSocket that stopped answering is
+# closed within this time, putting the device back in poll mode
+AVAILABILITY_TIMEOUT: Final = 30
+# WebSocket heartbeat (seconds): a socket silent for this long is pinged,
+# and closed when the pong does not arrive within half of it
+WS_PING_INTERVAL: Final = AVAILABILITY_TIMEOUT * 2 / 3
+# Time allowed for a first RPC over the WebSocket before assuming the
+# firmware only answers RPC over HTTP
+WS_RPC_PROBE_TIMEOUT: Final = 3
 
 # JSON-RPC Methods
 RPC_METHOD_GET_STATUS: Final = "Thermostat.GetStatus"
@@ -36,6 +74,70 @@ RPC_METHOD_GET_OTA_STATUS: Final = "System.GetOTAStatus"
 
 # WebSocket Notifications
 WS_NOTIFY_STATUS: Final = "NotifyStatus"
+WS_NOTIFY_OTA: Final = "NotifyOTA"
+
+# NotifyStatus subscription, sent over each new WebSocket connection: the
+# fields to notify, at most once per coalescing window, and only when a
+# field changed by at least the threshold
+RPC_METHOD_SUBSCRIBE: Final = "System.Subscribe"
+WS_SUBSCRIBE_THRESHOLD: Final = 0.1
+
+# OTA states during which the OTA status is followed (seconds between polls)
+OTA_ACTIVE_STATES: Final = ("checking", "downloading", "applying")
+OTA_POLL_INTERVAL: Final = 2
+# Time without any OTA status (seconds) after which a running update is
+# assumed lost and its state reset to idle
+OTA_STATUS_TIMEOUT: Final = 300
+# OTA states reported by a failed update
+OTA_FAILED_STATES: Final = ("error", "failed")
+
+# Fleet index (device registry id and MAC address to coordinator)
+DATA_DEVICE_INDEX: Final = "acit_device_index"
+
+# Services
+SERVICE_CHECK_UPDATE: Final = "check_update"
+SERVICE_CHECK_UPDATE_ALL: Final = "check_update_all"
+SERVICE_INSTALL_UPDATE_ALL: Final = "install_update_all"
+ATTR_MODEL: Final = "model"
+ATTR_MAX_CONCURRENT: Final = "max_concurrent"
+ATTR_MAX_FAILURES: Final = "max_failures"
+FLEET_MAX_CONCURRENT_CHECKS: Final = 10
+DEFAULT_ROLLOUT_MAX_CONCURRENT: Final = 5
+MAX_ROLLOUT_MAX_CONCURRENT: Final = 50
+DEFAULT_ROLLOUT_MAX_FAILURES: Final = 0
+# Time allowed for one device to download, apply and come back on the new
+# firmware (seconds)
+OTA_ROLLOUT_TIMEOUT: Final = 900
+# Longest interval (seconds) between two checks of a device whose update is
+# no longer running but that is not back on a new firmware yet
+OTA_ROLLOUT_MAX_POLL_INTERVAL: Final = 60
+
+# Options
+CONF_COALESCE_WINDOW: Final = "coalesce_window"
+# NotifyStatus frames within this window (seconds) are merged into one publish
+DEFAULT_COALESCE_WINDOW: Final = 0.25
+MAX_COALESCE_WINDOW: Final = 5.0
+CONF_HISTORY_WINDOW: Final = "history_window"
+# Window of the rolling statistics sensors (minutes)
+DEFAULT_HISTORY_WINDOW: Final = 15
+MAX_HISTORY_WINDOW: Final = 1440
+CONF_TRACE_SAMPLE_RATE: Final = "trace_sample_rate"
+# Share of NotifyStatus frames timed through parse, merge and publish (%),
+# 0 disables tracing
+DEFAULT_TRACE_SAMPLE_RATE: Final = 0
+
+# Rolling statistics: samples are aggregated in buckets of this many
+# seconds, lengthened so a window never needs more than HISTORY_MAX_BUCKETS,
+# so the whole window fits whatever the sample rate
+HISTORY_RESOLUTION: Final = 5
+HISTORY_MAX_BUCKETS: Final = 360
+
+# Setpoint writes: requests within this window (seconds) of the first one
+# are collapsed into a single write of the latest value
+SETPOINT_DEBOUNCE: Final = 0.3
+# Time allowed for the device to report a written setpoint (seconds) before
+# it is read back once, then rolled back if it still does not match
+SETPOINT_CONFIRM_TIMEOUT: Final = 5
 
 # Temperature limits
 MIN_TEMP: Final = 5.0
@@ -48,8 +150,16 @@ HVAC_MODE_HEAT: Final = "heat"
 HVAC_MODE_COOL: Final = "cool"
 HVAC_MODE_AUTO: Final = "auto"
 
-# Update interval (seconds) - used as fallback if WebSocket fails
+# Update interval (seconds) - only polled while the WebSocket is down
 UPDATE_INTERVAL: Final = 30
 
-# Availability timeout (seconds)
-AVAILABILITY_TIMEOUT: Final = 60
+# Fleet poll scheduler
+DATA_SCHEDULER: Final = "acit_scheduler"
+SCHEDULER_MAX_CONCURRENT_POLLS: Final = 8
+
+# Upper bounds (seconds) of the per-method RPC latency histogram buckets
+RPC_LATENCY_BUCKETS: Final = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds (seconds) of the message trace histogram buckets
+TRACE_LATENCY_BUCKETS: Final = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01, 0.05, 0.25, 1.0
+)
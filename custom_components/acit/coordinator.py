@@ -2,34 +2,102 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from datetime import timedelta
-from typing import Any
+import random
+import time
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import replace
+from typing import Any, Final
 
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from . import codec
 from .const import (
+    CONF_COALESCE_WINDOW,
+    CONF_HISTORY_WINDOW,
+    CONF_TRACE_SAMPLE_RATE,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_HISTORY_WINDOW,
+    DEFAULT_TRACE_SAMPLE_RATE,
     DOMAIN,
+    HISTORY_MAX_BUCKETS,
+    HISTORY_RESOLUTION,
+    OTA_ACTIVE_STATES,
+    OTA_POLL_INTERVAL,
+    OTA_STATUS_TIMEOUT,
     RPC_ENDPOINT,
+    RPC_METHOD_CHECK_UPDATE,
     RPC_METHOD_GET_CONFIG,
+    RPC_METHOD_GET_OTA_STATUS,
     RPC_METHOD_GET_STATUS,
     RPC_METHOD_SET_TARGET_TEMP,
+    RPC_METHOD_START_OTA,
+    RPC_METHOD_SUBSCRIBE,
     RPC_TIMEOUT,
-    UPDATE_INTERVAL,
+    SETPOINT_CONFIRM_TIMEOUT,
+    SETPOINT_DEBOUNCE,
+    STORAGE_KEY_DEVICE_CONFIG,
+    STORAGE_VERSION,
+    TEMP_STEP,
     WS_ENDPOINT,
+    WS_NOTIFY_OTA,
     WS_NOTIFY_STATUS,
+    WS_PING_INTERVAL,
     WS_RECONNECT_DELAY,
+    WS_RECONNECT_MAX_DELAY,
+    WS_RPC_PROBE_TIMEOUT,
+    WS_STABLE_CONNECTION,
+    WS_SUBSCRIBE_THRESHOLD,
 )
+from .history import RollingWindow, TimeIntegral
+from .models import ACITDeviceState, get_model_config
+from .scheduler import async_get_scheduler
+from .telemetry import ACITTelemetry
+from .transport import async_get_transport
 
 _LOGGER = logging.getLogger(__name__)
 
+# Headers for pre-serialized JSON-RPC bodies
+RPC_HEADERS: Final = {"Content-Type": "application/json"}
 
-class ACITThermACECCoordinator(DataUpdateCoordinator):
+# Fields reported by Thermostat.GetStatus and NotifyStatus
+STATUS_FIELDS: Final = ("temperature", "target_temperature", "heater_level", "fan_speed")
+
+# Fields with rolling statistics, stored as <field>_stats
+HISTORY_FIELDS: Final = ("temperature", "heater_level")
+
+
+def _reconnect_delay(failures: int) -> float:
+    """Return the delay before the next WebSocket attempt.
+
+    The delay doubles with each consecutive failure up to
+    WS_RECONNECT_MAX_DELAY, and is drawn from the upper half of that range
+    so devices that dropped together do not reconnect in lockstep.
+    """
+    ceiling = min(WS_RECONNECT_MAX_DELAY, WS_RECONNECT_DELAY * 2 ** min(failures, 16))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+class RPCProtocolError(UpdateFailed):
+    """The device answered, but not with a usable JSON-RPC response."""
+
+
+@callback
+def async_get_device_config_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[dict[str, Any]]:
+    """Return the store holding the cached configuration of a device."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_DEVICE_CONFIG}.{entry_id}")
+
+
+class ACITThermACECCoordinator(DataUpdateCoordinator[ACITDeviceState]):
     """Coordinator to manage ACIT ThermACEC data via HTTP RPC + WebSocket."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -38,45 +106,126 @@ class ACITThermACECCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # Polls are driven by the fleet scheduler
+            update_interval=None,
         )
         self.entry = entry
         self._host = entry.data[CONF_HOST]
         self._port = entry.data.get(CONF_PORT, 80)
         self._rpc_id = 1
 
-        # HTTP session
-        self._session: aiohttp.ClientSession | None = None
+        # JSON-RPC batch support (None until the device has been probed)
+        self._batch_supported: bool | None = None
+
+        # Shared HTTP transport
+        self._transport = async_get_transport(hass)
 
         # WebSocket
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._ws_task: asyncio.Task | None = None
         self._ws_connected = False
 
-        # Device info
+        # RPC over WebSocket: requests waiting for a response, by JSON-RPC id.
+        # Support is probed again on every connection (None until answered).
+        self._ws_pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._ws_rpc_supported: bool | None = None
+        self._ws_resync_task: asyncio.Task | None = None
+
+        # NotifyStatus subscription: status fields needed by the entities
+        # added to Home Assistant, the fields subscribed on the current
+        # connection, and whether the firmware accepts subscriptions (None
+        # until answered on the current connection)
+        self._required_fields: Counter[str] = Counter()
+        self._subscribed_fields: frozenset[str] | None = None
+        self._ws_subscribe_supported: bool | None = None
+        self._subscribe_task: asyncio.Task | None = None
+
+        # Fleet scheduler registration
+        self._unsub_scheduler: CALLBACK_TYPE | None = None
+
+        # Device info, cached across restarts
         self._device_info: dict[str, Any] = {}
+        self._device_info_cached = False
+        self._store: Store[dict[str, Any]] = async_get_device_config_store(
+            hass, entry.entry_id
+        )
+
+        # Transport counters and latencies, for diagnostics
+        self.telemetry = ACITTelemetry()
+
+        # Sampled tracing of NotifyStatus frames: share of frames traced, and
+        # reception time of the traced frame waiting to be published
+        self._trace_rate: float = (
+            entry.options.get(CONF_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SAMPLE_RATE) / 100
+        )
+        self._trace_received: float | None = None
+
+        # Problems already logged as warnings: repeats are logged at debug
+        # level until the problem is resolved
+        self._logged_issues: set[str] = set()
+
+        # Keys of self.data changed since the last publish, and by the last one
+        self._pending_changes: set[str] = set()
+        self.changed_keys: frozenset[str] = frozenset()
+
+        # Coalescing of NotifyStatus bursts
+        self._coalesce_window: float = entry.options.get(
+            CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+        )
+        self._last_publish = 0.0
+        self._publish_handle: asyncio.TimerHandle | None = None
+
+        # Recent samples of the fields with rolling statistics
+        history_window = 60 * entry.options.get(
+            CONF_HISTORY_WINDOW, DEFAULT_HISTORY_WINDOW
+        )
+        self._history = {
+            key: RollingWindow(history_window, HISTORY_RESOLUTION, HISTORY_MAX_BUCKETS)
+            for key in HISTORY_FIELDS
+        }
 
-        # Consecutive error counter
-        self._consecutive_errors = 0
-        self._max_consecutive_errors = 3  # Max errors before marking as unavailable
+        # Heater level integrated over time (% x seconds). Subscribed
+        # notifications only carry the fields that changed, so the level is
+        # held across frames until the device is lost.
+        self._heater_time = TimeIntegral()
+        self._heater_time_restored = False
+
+        # OTA tracking: status is only polled while an update is running,
+        # and not at all while the device pushes it
+        self._ota_task: asyncio.Task | None = None
+        self._ota_last_status = 0.0
+
+        # Setpoint write queue: latest requested value not sent yet, callers
+        # waiting for the outcome, and the task writing it (one at a time)
+        self._setpoint_pending: float | None = None
+        self._setpoint_waiters: list[asyncio.Future[None]] = []
+        self._setpoint_task: asyncio.Task | None = None
+
+        # Optimistic setpoint: value shown until the device reports it, the
+        # last value the device did report, and the pending confirmation check
+        self._setpoint_optimistic: float | None = None
+        self._setpoint_confirmed: float | None = None
+        self._setpoint_confirm_handle: asyncio.TimerHandle | None = None
 
         # Device data
-        self.data: dict[str, Any] = {
-            "temperature": None,
-            "target_temperature": None,
-            "heater_level": None,
-            "fan_speed": None,
-            "available": False,
-            "ota": {
-                "update_available": False,
-                "available_version": None,
-                "state": "idle",
-                "progress": None,
-                "channel": "stable",
-                "size": None,
-                "mandatory": False,
-                "release_url": None,
-            },
+        self.data = ACITDeviceState()
+
+    @property
+    def needs_poll(self) -> bool:
+        """Return whether the device has to be polled (no push connection)."""
+        return not self._ws_connected
+
+    @property
+    def connection_info(self) -> dict[str, Any]:
+        """Return the transport state and the firmware capabilities probed."""
+        return {
+            "websocket_connected": self._ws_connected,
+            "batch_supported": self._batch_supported,
+            "websocket_rpc_supported": self._ws_rpc_supported,
+            "subscribe_supported": self._ws_subscribe_supported,
+            "subscribed_fields": (
+                None if self._subscribed_fields is None else sorted(self._subscribed_fields)
+            ),
         }
 
     @property
@@ -85,261 +234,1133 @@ class ACITThermACECCoordinator(DataUpdateCoordinator):
         return self._device_info
 
     async def async_config_entry_first_refresh(self) -> None:
-        """First refresh during setup."""
-        # Create HTTP session
-        self._session = aiohttp.ClientSession()
+        """First refresh during setup.
 
-        # Retrieve device configuration
+        Only the device identity, needed to register the device and its
+        entities, blocks setup. The WebSocket, the OTA state and the first
+        status fetch are started alongside it and finish in the background.
+        """
+        # Start WebSocket
+        self._ws_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_websocket_loop(),
+            f"{DOMAIN} {self._host} WebSocket",
+        )
+
+        # Retrieve device configuration (from cache when available)
         await self._async_get_device_config()
 
-        # Check for available OTA updates
-        await self.async_check_ota_update()
+        # OTA state and first data refresh
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_setup_background(),
+            f"{DOMAIN} {self._host} setup",
+        )
 
-        # Start WebSocket
-        self._ws_task = self.hass.async_create_task(self._async_websocket_loop())
+        # Fallback polls
+        self._unsub_scheduler = async_get_scheduler(self.hass).async_register(self)
 
-        # First data refresh
-        await super().async_config_entry_first_refresh()
+    async def _async_setup_background(self) -> None:
+        """Run the setup steps that are not needed to register the device."""
+        steps = [self._async_get_ota_state(), self.async_refresh()]
+        if self._device_info_cached:
+            steps.append(self.async_revalidate_device_config())
+        await asyncio.gather(*steps)
 
-    async def _async_rpc_call(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Effectuer un appel RPC."""
-        if self._session is None:
-            raise UpdateFailed("HTTP session not initialized")
+        # Publish OTA changes that landed after the refresh
+        self._async_publish()
 
-        url = f"http://{self._host}:{self._port}{RPC_ENDPOINT}"
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._rpc_id,
-            "method": method,
-            "params": params or {},
-        }
+    def _next_request(self, method: str, params: dict[str, Any] | None) -> tuple[int, bytes]:
+        """Serialize a JSON-RPC request with a fresh id."""
+        request_id = self._rpc_id
         self._rpc_id += 1
+        return request_id, codec.encode_request(request_id, method, params)
 
-        _LOGGER.debug(f"RPC call: {method} - {params}")
+    @property
+    def _ws_rpc_usable(self) -> bool:
+        """Return whether RPC requests can be sent over the WebSocket."""
+        return (
+            self._ws is not None
+            and not self._ws.closed
+            and self._ws_rpc_supported is True
+        )
+
+    async def _async_send_rpc(
+        self, request_id: int, payload: bytes, label: str, ws_probe: bool = False
+    ) -> Any:
+        """Send a JSON-RPC request over the WebSocket if possible, HTTP otherwise."""
+        if ws_probe or self._ws_rpc_usable:
+            response = await self._async_ws_rpc_call(
+                request_id, payload, label, probe=ws_probe
+            )
+            if response is not None:
+                self.telemetry.rpc_over_ws += 1
+                return response
+
+        self.telemetry.rpc_over_http += 1
+        return await self._async_post_rpc(payload, label)
+
+    async def _async_ws_rpc_call(
+        self, request_id: int, payload: bytes, label: str, probe: bool = False
+    ) -> dict[str, Any] | None:
+        """Send a JSON-RPC request over the open WebSocket and await its response.
+
+        Returns None when the request could not be written to the socket,
+        so the caller can send it over HTTP instead. A request written to
+        the socket may have been executed, so it is never sent again: no
+        answer in time fails it. A probe is only given WS_RPC_PROBE_TIMEOUT,
+        after which the firmware is taken as not answering RPC over the
+        WebSocket.
+        """
+        ws = self._ws
+        if ws is None:
+            return None
+
+        future: asyncio.Future[dict[str, Any]] = self.hass.loop.create_future()
+        self._ws_pending[request_id] = future
+        timeout = WS_RPC_PROBE_TIMEOUT if probe else RPC_TIMEOUT
 
         try:
-            async with self._session.post(
-                url,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=RPC_TIMEOUT),
-            ) as response:
-                if response.status != 200:
-                    raise UpdateFailed(f"HTTP error {response.status}")
+            try:
+                await ws.send_str(payload.decode())
+            except (aiohttp.ClientError, ConnectionError) as err:
+                _LOGGER.debug("Unable to send RPC over WebSocket: %s", err)
+                return None
 
-                result = await response.json()
+            async with asyncio.timeout(timeout):
+                response = await future
+        except asyncio.TimeoutError as err:
+            if probe:
+                _LOGGER.debug("No RPC answer over WebSocket from %s, using HTTP", self._host)
+                self._ws_rpc_supported = False
+            raise UpdateFailed(f"RPC call timeout: {label}") from err
+        finally:
+            self._ws_pending.pop(request_id, None)
+
+        self._ws_rpc_supported = True
+        return response
 
-                if "error" in result:
-                    error = result["error"]
-                    raise UpdateFailed(f"RPC error: {error.get('message', 'Unknown error')}")
+    def _fail_ws_pending(self) -> None:
+        """Fail the RPC requests still waiting on a WebSocket that went away."""
+        for future in self._ws_pending.values():
+            if not future.done():
+                future.set_exception(UpdateFailed("WebSocket closed"))
+        self._ws_pending.clear()
 
-                _LOGGER.debug(f"RPC response: {result.get('result')}")
-                return result.get("result", {})
+    async def _async_post_rpc(self, payload: bytes, label: str) -> Any:
+        """POST a JSON-RPC payload to the device and return the decoded body."""
+        url = f"http://{self._host}:{self._port}{RPC_ENDPOINT}"
+
+        try:
+            async with self._transport.request_slot(self._host, self._port):
+                async with self._transport.session.post(
+                    url,
+                    data=payload,
+                    headers=RPC_HEADERS,
+                    timeout=aiohttp.ClientTimeout(total=RPC_TIMEOUT),
+                ) as response:
+                    if response.status != 200:
+                        raise RPCProtocolError(f"HTTP error {response.status}")
+
+                    body = await response.read()
 
         except asyncio.TimeoutError as err:
-            raise UpdateFailed(f"RPC call timeout: {method}") from err
+            raise UpdateFailed(f"RPC call timeout: {label}") from err
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Connection error: {err}") from err
 
+        try:
+            return codec.decode(body)
+        except codec.DecodeError as err:
+            raise RPCProtocolError(f"Invalid JSON-RPC response: {err}") from err
+
+    def _log_issue(self, issue: str, msg: str, *args: Any) -> None:
+        """Log a problem as a warning once, then at debug level until resolved."""
+        if issue in self._logged_issues:
+            _LOGGER.debug(msg, *args)
+            return
+
+        self._logged_issues.add(issue)
+        _LOGGER.warning(msg, *args)
+
+    def _resolve_issue(self, issue: str, msg: str | None = None, *args: Any) -> None:
+        """Mark a problem logged by _log_issue as resolved, logging msg if given."""
+        if issue not in self._logged_issues:
+            return
+
+        self._logged_issues.discard(issue)
+        if msg is not None:
+            _LOGGER.info(msg, *args)
+
+    @staticmethod
+    def _unwrap_rpc_response(response: dict[str, Any]) -> dict[str, Any]:
+        """Return the result of a JSON-RPC response, raising on RPC errors."""
+        if "error" in response:
+            error = response["error"]
+            raise UpdateFailed(f"RPC error: {error.get('message', 'Unknown error')}")
+
+        return response.get("result", {})
+
+    async def _async_rpc_call(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        ws_probe: bool = False,
+    ) -> dict[str, Any]:
+        """Effectuer un appel RPC.
+
+        With ws_probe, the call is sent over the WebSocket even though the
+        firmware has not answered RPC on it yet, to find out whether it does.
+        """
+        _LOGGER.debug("RPC call: %s - %s", method, params)
+
+        request_id, payload = self._next_request(method, params)
+        start = self.hass.loop.time()
+        try:
+            response = await self._async_send_rpc(request_id, payload, method, ws_probe)
+            result = self._unwrap_rpc_response(response)
+        except UpdateFailed:
+            self.telemetry.record_rpc(method, self.hass.loop.time() - start, False)
+            raise
+        self.telemetry.record_rpc(method, self.hass.loop.time() - start, True)
+
+        _LOGGER.debug("RPC response: %s", result)
+        return result
+
+    async def _async_rpc_batch(
+        self, calls: list[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any] | UpdateFailed]:
+        """Send several RPC calls in a single JSON-RPC 2.0 batch.
+
+        Returns one entry per call, in order: the call result, or the
+        UpdateFailed describing why that call failed. A transport failure
+        fails every call of the batch, while a batch answered with an HTTP
+        error or an invalid body is retried call by call. Firmware that
+        rejects batches is detected on the first attempt and served call by
+        call afterwards.
+        """
+        if self._ws_rpc_usable:
+            # Requests are pipelined on the open socket, no batch needed
+            return list(
+                await asyncio.gather(
+                    *(self._async_rpc_call_or_error(method, params) for method, params in calls)
+                )
+            )
+
+        if len(calls) == 1 or self._batch_supported is False:
+            return await self._async_rpc_sequence(calls)
+
+        requests = [self._next_request(method, params) for method, params in calls]
+        label = ", ".join(method for method, _ in calls)
+        _LOGGER.debug("RPC batch: %s", label)
+
+        self.telemetry.rpc_over_http += 1
+        start = self.hass.loop.time()
+        try:
+            response = await self._async_post_rpc(
+                codec.encode_batch([payload for _, payload in requests]), label
+            )
+        except RPCProtocolError as err:
+            return await self._async_rpc_batch_rejected(calls, err)
+        except UpdateFailed as err:
+            # Transport and HTTP errors, such as a device still booting, say
+            # nothing about batch support
+            self._record_batch(calls, start, None)
+            return [err] * len(calls)
+
+        if not isinstance(response, list):
+            # Firmware without batches answers with a single JSON-RPC
+            # response, typically an Invalid Request error
+            if self._batch_supported is None and isinstance(response, dict):
+                _LOGGER.debug(
+                    "JSON-RPC batches not supported by %s: %s",
+                    self._host,
+                    response.get("error"),
+                )
+                self._batch_supported = False
+                return await self._async_rpc_sequence(calls)
+            self._record_batch(calls, start, None)
+            return [RPCProtocolError("Batch answered with a single response")] * len(calls)
+
+        self._batch_supported = True
+        responses = {
+            item.get("id"): item for item in response if isinstance(item, dict)
+        }
+
+        results: list[dict[str, Any] | UpdateFailed] = []
+        for (request_id, _), (method, _) in zip(requests, calls, strict=True):
+            if (item := responses.get(request_id)) is None:
+                results.append(UpdateFailed(f"No response for {method}"))
+                continue
+            try:
+                results.append(self._unwrap_rpc_response(item))
+            except UpdateFailed as err:
+                results.append(err)
+
+        self._record_batch(calls, start, results)
+        _LOGGER.debug("RPC batch response: %s", results)
+        return results
+
+    async def _async_rpc_batch_rejected(
+        self, calls: list[tuple[str, dict[str, Any] | None]], err: RPCProtocolError
+    ) -> list[dict[str, Any] | UpdateFailed]:
+        """Retry call by call a batch answered with an HTTP error or invalid body.
+
+        Firmware may choke on a JSON array it does not expect: when the
+        calls then succeed one by one, batches are turned off.
+        """
+        _LOGGER.debug("RPC batch rejected by %s: %s", self._host, err)
+        results = await self._async_rpc_sequence(calls)
+        if self._batch_supported is None and any(
+            not isinstance(result, UpdateFailed) for result in results
+        ):
+            _LOGGER.debug("JSON-RPC batches not supported by %s", self._host)
+            self._batch_supported = False
+        return results
+
+    def _record_batch(
+        self,
+        calls: list[tuple[str, dict[str, Any] | None]],
+        start: float,
+        results: list[dict[str, Any] | UpdateFailed] | None,
+    ) -> None:
+        """Record the calls of a batch, each with the latency of the round trip."""
+        latency = self.hass.loop.time() - start
+        for index, (method, _) in enumerate(calls):
+            success = results is not None and not isinstance(results[index], UpdateFailed)
+            self.telemetry.record_rpc(method, latency, success)
+
+    async def _async_rpc_sequence(
+        self, calls: list[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any] | UpdateFailed]:
+        """Send RPC calls one by one, with the same result shape as a batch."""
+        return [await self._async_rpc_call_or_error(method, params) for method, params in calls]
+
+    async def _async_rpc_call_or_error(
+        self, method: str, params: dict[str, Any] | None
+    ) -> dict[str, Any] | UpdateFailed:
+        """Make an RPC call, returning its error instead of raising it."""
+        try:
+            return await self._async_rpc_call(method, params)
+        except UpdateFailed as err:
+            return err
+
     async def _async_get_device_config(self) -> None:
-        """Retrieve device configuration."""
+        """Retrieve device configuration.
+
+        The last configuration received from the device is cached, so setup
+        does not wait for the device once it has been seen. The cache is
+        revalidated in the background.
+        """
+        if (cached := await self._store.async_load()) is not None:
+            _LOGGER.debug("Using cached device configuration: %s", cached)
+            self._device_info = cached
+            self._device_info_cached = True
+            return
+
         try:
             config = await self._async_rpc_call(RPC_METHOD_GET_CONFIG)
+        except UpdateFailed as err:
+            raise ConfigEntryNotReady(
+                f"Error retrieving device configuration: {err}"
+            ) from err
 
-            # Log raw response for debug
-            _LOGGER.info(f"Raw Thermostat.GetConfig response: {config}")
+        self._apply_device_config(config)
+        await self._store.async_save(self._device_info)
 
-            # Check if version is present
-            version = config.get("version")
-            if version:
-                _LOGGER.info(f"✅ Firmware version received: {version}")
-            else:
-                _LOGGER.warning(f"⚠️ No firmware version in response! Full response: {config}")
-
-            self._device_info = {
-                "model": config.get("model", "ThermACEC"),
-                "version": config.get("version", "Unavailable"),
-                "manufacturer": config.get("manufacturer", "ACIT"),
-                "mac_address": config.get("mac_address", ""),
-                "min_temp": config.get("min_temp", 5),
-                "max_temp": config.get("max_temp", 35),
-                "features": config.get("features", []),
-            }
-            _LOGGER.info(f"Device configuration: {self._device_info}")
+    async def async_revalidate_device_config(self) -> bool:
+        """Check the known configuration against the device.
+
+        The entry is reloaded when the firmware version changed, so the
+        device registry and the entities pick up the new configuration.
+        Returns whether the device answered.
+        """
+        try:
+            config = await self._async_rpc_call(RPC_METHOD_GET_CONFIG)
         except UpdateFailed as err:
-            _LOGGER.error(f"Error retrieving device configuration: {err}")
-            # Use default values
-            self._device_info = {
-                "model": "ThermACEC",
-                "version": "Unavailable",
-                "manufacturer": "ACIT",
-                "mac_address": "",
-                "min_temp": 5,
-                "max_temp": 35,
-                "features": [],
-            }
+            _LOGGER.debug("Unable to revalidate device configuration: %s", err)
+            return False
+
+        previous_version = self._device_info.get("version")
+        if config.get("version", "Unavailable") == previous_version:
+            return True
+
+        self._apply_device_config(config)
+        await self._store.async_save(self._device_info)
+
+        _LOGGER.info(
+            "Firmware of %s changed from %s to %s, reloading",
+            self._host,
+            previous_version,
+            self._device_info["version"],
+        )
+        self.hass.async_create_task(
+            self.hass.config_entries.async_reload(self.entry.entry_id)
+        )
+        return True
+
+    async def _async_get_ota_state(self) -> None:
+        """Retrieve OTA availability and status in a single round trip."""
+        ota_check, ota_status = await self._async_rpc_batch(
+            [(RPC_METHOD_CHECK_UPDATE, None), (RPC_METHOD_GET_OTA_STATUS, None)]
+        )
+
+        if isinstance(ota_check, UpdateFailed):
+            _LOGGER.error("Error checking OTA update: %s", ota_check)
+        else:
+            self._apply_ota_check(ota_check)
+
+        if isinstance(ota_status, UpdateFailed):
+            _LOGGER.debug("Unable to retrieve OTA status: %s", ota_status)
+        else:
+            self._apply_ota_status(ota_status)
+
+    def _apply_device_config(self, config: dict[str, Any]) -> None:
+        """Store a Thermostat.GetConfig result as the device information."""
+        # Log raw response for debug
+        _LOGGER.debug("Raw Thermostat.GetConfig response: %s", config)
+
+        # Check if version is present
+        if config.get("version"):
+            self._resolve_issue("version")
+        else:
+            self._log_issue(
+                "version", "No firmware version reported by %s: %s", self._host, config
+            )
+
+        self._device_info = {
+            "model": config.get("model", "ThermACEC"),
+            "version": config.get("version", "Unavailable"),
+            "manufacturer": config.get("manufacturer", "ACIT"),
+            "mac_address": config.get("mac_address", ""),
+            "min_temp": config.get("min_temp", 5),
+            "max_temp": config.get("max_temp", 35),
+            "features": config.get("features", []),
+            "rated_power": config.get("rated_power"),
+        }
+        _LOGGER.debug("Device configuration: %s", self._device_info)
 
     async def _async_websocket_loop(self) -> None:
         """WebSocket connection loop."""
+        failures = 0
         while True:
             try:
-                await self._async_connect_websocket()
+                stable = await self._async_connect_websocket()
             except asyncio.CancelledError:
                 _LOGGER.debug("WebSocket task cancelled")
                 break
             except Exception as err:
-                _LOGGER.error(f"WebSocket error: {err}")
-                self._ws_connected = False
-                self.data["available"] = False
-                self.async_set_updated_data(self.data)
-
-            # Wait before reconnecting
-            _LOGGER.info(f"Reconnecting WebSocket in {WS_RECONNECT_DELAY}s...")
-            await asyncio.sleep(WS_RECONNECT_DELAY)
-
-    async def _async_connect_websocket(self) -> None:
-        """Connect to the WebSocket."""
-        if self._session is None:
-            return
-
+                self._log_issue("websocket", "WebSocket error with %s: %s", self._host, err)
+                # The device stays in poll mode, whose results alone decide
+                # whether it is available
+                stable = False
+
+            # Wait before reconnecting, backing off while attempts keep failing
+            if not stable:
+                self.telemetry.ws_failures += 1
+            failures = 0 if stable else failures + 1
+            delay = _reconnect_delay(failures)
+            _LOGGER.debug("Reconnecting WebSocket in %.1fs", delay)
+            await asyncio.sleep(delay)
+
+    async def _async_connect_websocket(self) -> bool:
+        """Connect to the WebSocket and listen until it closes.
+
+        Returns whether the connection stayed open for WS_STABLE_CONNECTION.
+        """
         url = f"ws://{self._host}:{self._port}{WS_ENDPOINT}"
-        _LOGGER.info(f"Connecting WebSocket to {url}")
+        _LOGGER.debug("Connecting WebSocket to %s", url)
+        self.telemetry.ws_attempts += 1
 
         try:
-            async with self._session.ws_connect(url) as ws:
-                self._ws = ws
-                self._ws_connected = True
-                self.data["available"] = True
-                self.async_set_updated_data(self.data)
+            # Handshakes are admitted fleet-wide, the session itself is not.
+            # The heartbeat closes a socket that stopped answering within
+            # AVAILABILITY_TIMEOUT, a healthy one is never polled.
+            async with self._transport.handshake_slot(), asyncio.timeout(RPC_TIMEOUT):
+                ws = await self._transport.session.ws_connect(
+                    url, heartbeat=WS_PING_INTERVAL
+                )
 
-                _LOGGER.info("WebSocket connected")
+            connected_at = self.hass.loop.time()
+            try:
+                self._async_ws_connected(ws)
 
                 # Listen for messages
                 async for msg in ws:
-                    if msg.type == aiohttp.WSMsgType.TEXT:
+                    self.telemetry.ws_messages += 1
+                    if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
                         await self._async_handle_ws_message(msg.data)
                     elif msg.type == aiohttp.WSMsgType.ERROR:
-                        _LOGGER.error(f"WebSocket error: {ws.exception()}")
+                        self._log_issue(
+                            "websocket",
+                            "WebSocket error with %s: %s",
+                            self._host,
+                            ws.exception(),
+                        )
                         break
                     elif msg.type == aiohttp.WSMsgType.CLOSED:
-                        _LOGGER.warning("WebSocket closed")
+                        _LOGGER.debug("WebSocket closed")
                         break
+            finally:
+                await ws.close()
+
+            return self.hass.loop.time() - connected_at >= WS_STABLE_CONNECTION
 
-        except aiohttp.ClientError as err:
-            _LOGGER.error(f"WebSocket connection error: {err}")
-            raise
         finally:
+            if self._subscribe_task is not None:
+                self._subscribe_task.cancel()
+                self._subscribe_task = None
+            if self._ws_resync_task is not None:
+                self._ws_resync_task.cancel()
+                self._ws_resync_task = None
+
+            was_connected = self._ws_connected
+            if was_connected:
+                # The level is unknown until the device is reached again
+                self._heater_time.stop(self.hass.loop.time())
             self._ws = None
             self._ws_connected = False
+            self._fail_ws_pending()
+
+            if was_connected and not self._shutdown_requested:
+                # Poll right away instead of waiting for the next slot, and
+                # restart the slots if the whole fleet was pushing
+                self.hass.async_create_task(self.async_request_refresh())
+                async_get_scheduler(self.hass).async_wake()
+
+    @callback
+    def _async_ws_connected(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Switch to push mode on a new WebSocket connection."""
+        self._ws = ws
+        self._ws_connected = True
+        # Firmware may have changed since the last connection: requests go
+        # over HTTP until the probe sent by the resync is answered
+        self._ws_rpc_supported = None
+        self._set_field("available", True)
+        self._async_publish()
+
+        _LOGGER.debug("WebSocket connected to %s", self._host)
+        self._resolve_issue("websocket", "WebSocket connection to %s restored", self._host)
+        self._resolve_issue("decode")
+        self._resolve_issue("poll")
+
+        # The device may have rebooted into new firmware
+        self.telemetry.ws_connections += 1
+        if self.telemetry.ws_connections > 1:
+            self.entry.async_create_background_task(
+                self.hass,
+                self.async_revalidate_device_config(),
+                f"{DOMAIN} {self._host} revalidate config",
+            )
+
+        # Push mode: the scheduler skips polls while the socket is open.
+        # Resynchronize once, then ask for the fields the entities need only.
+        self._subscribed_fields = None
+        self._ws_subscribe_supported = None
+        self._ws_resync_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_ws_resync(),
+            f"{DOMAIN} {self._host} WebSocket resync",
+        )
+
+    async def _async_ws_resync(self) -> None:
+        """Fetch the status on a new WebSocket, probing RPC support with it.
+
+        Thermostat.GetStatus is safe to send again, so when the firmware does
+        not answer it on the WebSocket it is requested once more over HTTP.
+        """
+        try:
+            try:
+                status = await self._async_rpc_call(RPC_METHOD_GET_STATUS, ws_probe=True)
+            except UpdateFailed:
+                if self._ws_rpc_supported is not False:
+                    raise
+                status = await self._async_rpc_call(RPC_METHOD_GET_STATUS)
+        except UpdateFailed as err:
+            _LOGGER.debug("Unable to resynchronize %s: %s", self._host, err)
+            return
+        finally:
+            self._ws_resync_task = None
+
+        self.telemetry.status_probes += 1
+        self._apply_status(status)
+        self._async_schedule_publish()
+        self._async_update_subscription()
+
+    @callback
+    def async_require_fields(self, fields: Iterable[str]) -> CALLBACK_TYPE:
+        """Request NotifyStatus fields, returning a callback to release them."""
+        fields = list(fields)
+        self._required_fields.update(fields)
+        self._async_update_subscription()
+
+        @callback
+        def _async_release() -> None:
+            self._required_fields.subtract(fields)
+            self._async_update_subscription()
+
+        return _async_release
+
+    @callback
+    def _async_update_subscription(self) -> None:
+        """Subscribe again if the required fields changed."""
+        if (
+            not self._ws_connected
+            or not self._ws_rpc_usable
+            or self._ws_subscribe_supported is False
+            or self._subscribe_task is not None
+        ):
+            return
+
+        self._subscribe_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_subscribe(),
+            f"{DOMAIN} {self._host} NotifyStatus subscription",
+        )
+
+    async def _async_subscribe(self) -> None:
+        """Subscribe to the required NotifyStatus fields on the WebSocket.
+
+        Firmware without subscriptions keeps sending its full stream, which
+        is handled the same way.
+        """
+        try:
+            while self._ws_connected:
+                fields = frozenset(+self._required_fields)
+                if not fields or fields == self._subscribed_fields:
+                    return
+
+                request_id, payload = self._next_request(
+                    RPC_METHOD_SUBSCRIBE,
+                    {
+                        "fields": sorted(fields),
+                        "min_interval": self._coalesce_window,
+                        "threshold": WS_SUBSCRIBE_THRESHOLD,
+                    },
+                )
+                try:
+                    response = await self._async_ws_rpc_call(
+                        request_id, payload, RPC_METHOD_SUBSCRIBE
+                    )
+                except UpdateFailed as err:
+                    _LOGGER.debug("NotifyStatus subscription failed: %s", err)
+                    return
+
+                if response is None or "error" in response:
+                    _LOGGER.debug(
+                        "%s does not support NotifyStatus subscriptions", self._host
+                    )
+                    self._ws_subscribe_supported = False
+                    return
+
+                self._ws_subscribe_supported = True
+                self._subscribed_fields = fields
+                _LOGGER.debug("Subscribed to NotifyStatus fields: %s", fields)
+        finally:
+            self._subscribe_task = None
 
-    async def _async_handle_ws_message(self, message: str) -> None:
+    async def _async_handle_ws_message(self, message: str | bytes) -> None:
         """Handle a WebSocket message."""
+        received = (
+            time.perf_counter()
+            if self._trace_rate and random.random() < self._trace_rate
+            else None
+        )
         try:
-            data = json.loads(message)
+            data = codec.decode(message)
+            if not isinstance(data, dict):
+                return
+            parsed = time.perf_counter() if received is not None else 0.0
+
+            # Response to an RPC request sent over the WebSocket
+            if "method" not in data:
+                future = self._ws_pending.get(data.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(data)
+                return
 
             # Check if it's a notification
             if data.get("method") == WS_NOTIFY_STATUS:
                 params = data.get("params", {})
-                _LOGGER.debug(f"Notification received: {params}")
+                _LOGGER.debug("Notification received: %s", params)
 
                 # Update data
-                self.data["temperature"] = params.get("temperature")
-                self.data["target_temperature"] = params.get("target_temperature")
-                self.data["heater_level"] = params.get("heater_level")
-                self.data["fan_speed"] = params.get("fan_speed")
-                self.data["available"] = True
+                self.telemetry.status_pushes += 1
+                self._apply_status(params)
+                if received is not None:
+                    self._trace_status(received, parsed)
+
+                # Notify entities of the fields that changed, merging bursts
+                self._async_schedule_publish()
 
-                # Notify entities
-                self.async_set_updated_data(self.data)
+            elif data.get("method") == WS_NOTIFY_OTA:
+                params = data.get("params", {})
+                _LOGGER.debug("OTA notification received: %s", params)
+
+                self._apply_ota_status(params)
+                self._async_schedule_publish()
 
-        except json.JSONDecodeError as err:
-            _LOGGER.error(f"JSON decode error: {err}")
+        except codec.DecodeError as err:
+            self._log_issue(
+                "decode", "Invalid message from %s: %s", self._host, err
+            )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    def _trace_status(self, received: float, parsed: float) -> None:
+        """Record the parse and merge times of a traced NotifyStatus frame."""
+        merged = time.perf_counter()
+        self.telemetry.trace["parse"].add(parsed - received)
+        self.telemetry.trace["merge"].add(merged - parsed)
+        _LOGGER.debug(
+            "Trace %s: parse %.3f ms, merge %.3f ms",
+            self._host,
+            (parsed - received) * 1000,
+            (merged - parsed) * 1000,
+        )
+
+        # Follow the frame until its changes reach the listeners
+        if self._pending_changes and self._trace_received is None:
+            self._trace_received = received
+
+    async def _async_update_data(self) -> ACITDeviceState:
         """Update data via RPC (fallback if WebSocket fails)."""
         if self._ws_connected:
             # If WebSocket is connected, data is updated automatically
-            # But we still check OTA status
-            await self.async_get_ota_status()
+            self._take_changes()
             return self.data
 
-        # Otherwise, fetch data via RPC
-        try:
-            status = await self._async_rpc_call(RPC_METHOD_GET_STATUS)
+        # Otherwise, fetch status via RPC, with the OTA status in the same
+        # round trip while an update is running
+        calls: list[tuple[str, dict[str, Any] | None]] = [(RPC_METHOD_GET_STATUS, None)]
+        if self.ota_in_progress:
+            calls.append((RPC_METHOD_GET_OTA_STATUS, None))
+        status, *ota_status = await self._async_rpc_batch(calls)
+
+        if isinstance(status, UpdateFailed):
+            self._log_issue("poll", "Unable to poll %s: %s", self._host, status)
+            self._heater_time.stop(self.hass.loop.time())
+            self._set_field("available", False)
+            self._take_changes()
+            return self.data
 
-            self.data["temperature"] = status.get("temperature")
-            self.data["target_temperature"] = status.get("target_temperature")
-            self.data["heater_level"] = status.get("heater_level")
-            self.data["fan_speed"] = status.get("fan_speed")
-            self.data["available"] = True
+        self.telemetry.status_polls += 1
+        self._resolve_issue("poll", "Polling %s recovered", self._host)
+        self._apply_status(status)
 
-            # Check OTA status
-            await self.async_get_ota_status()
+        for result in ota_status:
+            if isinstance(result, UpdateFailed):
+                _LOGGER.debug("Unable to retrieve OTA status: %s", result)
+            else:
+                self._apply_ota_status(result)
+
+        self._take_changes()
+        return self.data
+
+    def _apply_status(self, status: dict[str, Any]) -> None:
+        """Store a Thermostat.GetStatus result or NotifyStatus notification.
+
+        The fields are gathered first and the device data is replaced once
+        per status.
+        """
+        values: dict[str, Any] = {"available": True}
+        for key in STATUS_FIELDS:
+            # Subscribed notifications only carry the fields that changed
+            if key not in status:
+                continue
+            if key == "target_temperature" and self._setpoint_optimistic is not None:
+                self._reconcile_setpoint(status[key])
+                continue
+            values[key] = status[key]
+
+        # A field missing from the frame kept its last known value until now
+        now = self.hass.loop.time()
+        for key, window in self._history.items():
+            if (value := status.get(key, getattr(self.data, key))) is not None:
+                window.add(now, value)
+                values[f"{key}_stats"] = window.stats()
+
+        heater_level = status.get("heater_level", self.data.heater_level)
+        if heater_level is not None:
+            self._heater_time.add(now, heater_level)
+            values.update(self._heater_totals())
+
+        self._set_fields(values)
 
-            return self.data
+    @property
+    def rated_power(self) -> float | None:
+        """Return the heater power at 100 % heater level (W)."""
+        return (
+            self._device_info.get("rated_power")
+            or get_model_config(self._device_info.get("model", "ThermACEC")).rated_power
+        )
+
+    def _heater_totals(self) -> dict[str, float]:
+        """Derive the heating totals from the integrated heater level."""
+        duty_time = self._heater_time.total / 100 / 3600
+        totals = {"heater_duty_time": round(duty_time, 4)}
+        if (rated_power := self.rated_power) is not None:
+            totals["heater_energy"] = round(duty_time * rated_power / 1000, 4)
+        return totals
+
+    @callback
+    def async_restore_heater_total(self, key: str, value: float) -> None:
+        """Resume the heating totals from a value restored after a restart."""
+        if key == "heater_duty_time":
+            total = value * 100 * 3600
+        elif key == "heater_energy" and (rated_power := self.rated_power):
+            total = value * 1000 / rated_power * 100 * 3600
+        else:
+            return
+
+        # Both heating sensors restore the same total, only resume it once
+        if self._heater_time_restored:
+            return
+        self._heater_time_restored = True
+        self._heater_time.total += total
+        self._set_fields(self._heater_totals())
+        self._async_publish()
+
+    def _reconcile_setpoint(self, reported: float | None) -> None:
+        """Check a reported setpoint against the one shown optimistically.
+
+        A matching value confirms the write. Any other value is older than
+        the write, so it is only kept to roll back to.
+        """
+        self._setpoint_confirmed = reported
+        if (
+            reported is not None
+            and abs(reported - self._setpoint_optimistic) < TEMP_STEP / 2
+        ):
+            self._clear_optimistic_setpoint()
+            self._set_field("target_temperature", reported)
+
+    def _clear_optimistic_setpoint(self) -> None:
+        """Stop waiting for the device to report the written setpoint."""
+        self._setpoint_optimistic = None
+        if self._setpoint_confirm_handle is not None:
+            self._setpoint_confirm_handle.cancel()
+            self._setpoint_confirm_handle = None
+
+    @callback
+    def _async_rollback_setpoint(self) -> None:
+        """Show the setpoint last reported by the device again."""
+        _LOGGER.error(
+            "Target temperature %s was not applied by %s, reverting to %s",
+            self._setpoint_optimistic,
+            self._host,
+            self._setpoint_confirmed,
+        )
+        self._clear_optimistic_setpoint()
+        self._set_field("target_temperature", self._setpoint_confirmed)
+        self._async_publish()
+
+    @callback
+    def _async_schedule_setpoint_check(self) -> None:
+        """Check the written setpoint if the device does not report it in time."""
+        self._setpoint_confirm_handle = self.hass.loop.call_later(
+            SETPOINT_CONFIRM_TIMEOUT, self._async_start_setpoint_check
+        )
 
+    @callback
+    def _async_start_setpoint_check(self) -> None:
+        """Start reading the written setpoint back."""
+        self._setpoint_confirm_handle = None
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_check_setpoint(),
+            f"{DOMAIN} {self._host} setpoint check",
+        )
+
+    async def _async_check_setpoint(self) -> None:
+        """Read the setpoint back once, rolling back if it does not match."""
+        try:
+            status = await self._async_rpc_call(RPC_METHOD_GET_STATUS)
         except UpdateFailed as err:
-            _LOGGER.error(f"Error during data update: {err}")
-            self.data["available"] = False
-            return self.data
+            _LOGGER.debug("Unable to read back target temperature: %s", err)
+        else:
+            self._apply_status(status)
+
+        if self._setpoint_optimistic is not None and self._setpoint_task is None:
+            self._async_rollback_setpoint()
+        else:
+            self._async_publish()
+
+    def _set_field(self, key: str, value: Any) -> None:
+        """Set a field of the device data, recording it if it changed."""
+        self._set_fields({key: value})
+
+    def _set_fields(self, values: dict[str, Any]) -> None:
+        """Set fields of the device data at once, recording those that changed.
+
+        Replacing the frozen state costs the same for one field or many, so
+        a status is applied with a single replace.
+        """
+        data = self.data
+        changed = {
+            key: value for key, value in values.items() if getattr(data, key) != value
+        }
+        if changed:
+            self.data = replace(data, **changed)
+            self._pending_changes.update(changed)
+
+    def _set_ota_field(self, key: str, value: Any) -> None:
+        """Set a field of the OTA data, recording the change under "ota"."""
+        if getattr(self.data.ota, key) != value:
+            self.data = replace(self.data, ota=replace(self.data.ota, **{key: value}))
+            self._pending_changes.add("ota")
+
+    def _take_changes(self) -> bool:
+        """Expose the changes since the last publish as changed_keys."""
+        self.changed_keys = frozenset(self._pending_changes)
+        self._pending_changes.clear()
+        return bool(self.changed_keys)
+
+    @callback
+    def _async_publish(self) -> None:
+        """Notify listeners, if any field changed since the last publish."""
+        if self._publish_handle is not None:
+            self._publish_handle.cancel()
+            self._publish_handle = None
+
+        if self._take_changes():
+            self._last_publish = self.hass.loop.time()
+            self.async_set_updated_data(self.data)
+
+        if self._trace_received is not None:
+            elapsed = time.perf_counter() - self._trace_received
+            self._trace_received = None
+            self.telemetry.trace["publish"].add(elapsed)
+            _LOGGER.debug("Trace %s: published after %.3f ms", self._host, elapsed * 1000)
+
+    @callback
+    def _async_schedule_publish(self) -> None:
+        """Publish pushed changes at most once per coalescing window.
+
+        A frame arriving after a quiet period is published right away.
+        Frames arriving within the window of the last publish are merged
+        into data (latest value wins) and published together when the
+        window closes.
+        """
+        if self._publish_handle is not None or not self._pending_changes:
+            return
+
+        delay = self._last_publish + self._coalesce_window - self.hass.loop.time()
+        if delay <= 0:
+            self._async_publish()
+            return
+
+        self._publish_handle = self.hass.loop.call_later(delay, self._async_publish)
 
     async def async_set_target_temperature(self, temperature: float) -> None:
-        """Set the target temperature via RPC."""
-        try:
-            await self._async_rpc_call(
-                RPC_METHOD_SET_TARGET_TEMP,
-                {"temperature": temperature}
+        """Set the target temperature via RPC.
+
+        Writes are queued per device, latest value wins: requests made while
+        a write is debounced or in flight replace the value to send, and
+        every caller gets the outcome of the write that ends the burst.
+        """
+        # Show the new value right away, until the device reports it
+        if self._setpoint_optimistic is None:
+            self._setpoint_confirmed = self.data.target_temperature
+        self._clear_optimistic_setpoint()
+        self._setpoint_optimistic = temperature
+        self._set_field("target_temperature", temperature)
+        self._async_publish()
+
+        self._setpoint_pending = temperature
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        self._setpoint_waiters.append(waiter)
+
+        if self._setpoint_task is None:
+            self._setpoint_task = self.entry.async_create_background_task(
+                self.hass,
+                self._async_write_setpoints(),
+                f"{DOMAIN} {self._host} setpoint write",
             )
-            _LOGGER.info(f"Target temperature set to {temperature}°C")
-        except UpdateFailed as err:
-            _LOGGER.error(f"Error changing target temperature: {err}")
-            raise
+
+        await waiter
+
+    async def _async_write_setpoints(self) -> None:
+        """Write queued setpoints until none is left, one RPC at a time."""
+        error: UpdateFailed | None = None
+        completed = False
+        try:
+            await asyncio.sleep(SETPOINT_DEBOUNCE)
+
+            while (temperature := self._setpoint_pending) is not None:
+                self._setpoint_pending = None
+                try:
+                    await self._async_rpc_call(
+                        RPC_METHOD_SET_TARGET_TEMP,
+                        {"temperature": temperature}
+                    )
+                    _LOGGER.info("Target temperature set to %s°C", temperature)
+                    error = None
+                except UpdateFailed as err:
+                    _LOGGER.error("Error changing target temperature: %s", err)
+                    error = err
+            completed = True
+
+            if self._setpoint_optimistic is not None:
+                if error is not None:
+                    self._async_rollback_setpoint()
+                else:
+                    self._async_schedule_setpoint_check()
+        finally:
+            self._setpoint_task = None
+            waiters, self._setpoint_waiters = self._setpoint_waiters, []
+            for waiter in waiters:
+                if waiter.done():
+                    continue
+                if not completed:
+                    # Shut down before the latest value was written
+                    waiter.cancel()
+                elif error is not None:
+                    waiter.set_exception(error)
+                else:
+                    waiter.set_result(None)
 
     async def call_rpc(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Call an RPC method (public method for entities)."""
         return await self._async_rpc_call(method, params)
 
-    async def async_check_ota_update(self) -> None:
-        """Check for available OTA updates."""
+    async def async_check_ota_update(self) -> bool:
+        """Check for available OTA updates, returning whether the check succeeded."""
         try:
-            result = await self._async_rpc_call("System.CheckUpdate")
-
-            # Update OTA data
-            self.data["ota"]["update_available"] = result.get("update_available", False)
-            self.data["ota"]["available_version"] = result.get("version")
-            self.data["ota"]["channel"] = result.get("channel", "stable")
-            self.data["ota"]["size"] = result.get("size")
-            self.data["ota"]["mandatory"] = result.get("mandatory", False)
-
-            # Build release URL (GitHub)
-            if self.data["ota"]["update_available"]:
-                version = self.data["ota"]["available_version"]
-                model = self._device_info.get("model", "ThermACEC").lower()
-                self.data["ota"]["release_url"] = (
-                    f"https://github.com/jdu-acit/ACIT_ACCU_{model.upper()}_OTA/releases/tag/v{version}"
-                )
-
-            _LOGGER.debug(f"OTA check: {self.data['ota']}")
-
+            result = await self._async_rpc_call(RPC_METHOD_CHECK_UPDATE)
         except UpdateFailed as err:
-            _LOGGER.error(f"Error checking OTA update: {err}")
+            _LOGGER.error("Error checking OTA update: %s", err)
+            return False
+
+        self._apply_ota_check(result)
+        self._async_publish()
+        return True
+
+    def _apply_ota_check(self, result: dict[str, Any]) -> None:
+        """Store a System.CheckUpdate result."""
+        self._set_ota_field("update_available", result.get("update_available", False))
+        self._set_ota_field("available_version", result.get("version"))
+        self._set_ota_field("channel", result.get("channel", "stable"))
+        self._set_ota_field("size", result.get("size"))
+        self._set_ota_field("mandatory", result.get("mandatory", False))
+
+        # Build release URL (GitHub)
+        if self.data.ota.update_available:
+            version = self.data.ota.available_version
+            model = self._device_info.get("model", "ThermACEC").lower()
+            self._set_ota_field(
+                "release_url",
+                f"https://github.com/jdu-acit/ACIT_ACCU_{model.upper()}_OTA/releases/tag/v{version}",
+            )
+
+        _LOGGER.debug("OTA check: %s", self.data.ota)
 
     async def async_get_ota_status(self) -> None:
         """Retrieve the current OTA status."""
         try:
-            result = await self._async_rpc_call("System.GetOTAStatus")
+            result = await self._async_rpc_call(RPC_METHOD_GET_OTA_STATUS)
+        except UpdateFailed as err:
+            _LOGGER.debug("Unable to retrieve OTA status: %s", err)
+            return
 
-            self.data["ota"]["state"] = result.get("state", "idle")
-            self.data["ota"]["progress"] = result.get("progress")
+        self._apply_ota_status(result)
 
-            _LOGGER.debug(f"OTA status: {result.get('state')} - {result.get('progress')}%")
+    def _apply_ota_status(self, result: dict[str, Any]) -> None:
+        """Store a System.GetOTAStatus result or NotifyOTA notification."""
+        self._set_ota_field("state", result.get("state", "idle"))
+        self._set_ota_field("progress", result.get("progress"))
+        self._ota_last_status = self.hass.loop.time()
 
-        except UpdateFailed as err:
-            _LOGGER.debug(f"Unable to retrieve OTA status: {err}")
+        _LOGGER.debug(
+            "OTA status: %s - %s%%", result.get("state"), result.get("progress")
+        )
+
+        self._async_track_ota()
+
+    @property
+    def ota_in_progress(self) -> bool:
+        """Return whether an OTA update is running on the device."""
+        return self.data.ota.state in OTA_ACTIVE_STATES
+
+    @callback
+    def _async_track_ota(self) -> None:
+        """Follow the OTA status while an update is running."""
+        if not self.ota_in_progress or self._ota_task is not None:
+            return
+
+        self._ota_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_ota_poll_loop(),
+            f"{DOMAIN} {self._host} OTA status",
+        )
+
+    async def _async_ota_poll_loop(self) -> None:
+        """Poll System.GetOTAStatus until the update is no longer running.
+
+        Polls are skipped while the status keeps arriving on its own,
+        through NotifyOTA pushes or the fallback poll. Once no status has
+        arrived for OTA_STATUS_TIMEOUT, such as from firmware without
+        System.GetOTAStatus or a device that did not come back, the update
+        is assumed lost and the state is reset to idle.
+        """
+        started = self.hass.loop.time()
+        try:
+            while self.ota_in_progress:
+                await asyncio.sleep(OTA_POLL_INTERVAL)
+
+                now = self.hass.loop.time()
+                if now - self._ota_last_status < OTA_POLL_INTERVAL:
+                    continue
+
+                if now - max(self._ota_last_status, started) > OTA_STATUS_TIMEOUT:
+                    _LOGGER.warning(
+                        "No OTA status from %s for %ss, giving up on the update",
+                        self._host,
+                        OTA_STATUS_TIMEOUT,
+                    )
+                    self._set_ota_field("state", "idle")
+                    self._set_ota_field("progress", None)
+                    self._async_publish()
+                    break
+
+                await self.async_get_ota_status()
+                self._async_schedule_publish()
+        finally:
+            self._ota_task = None
+
+    async def async_start_ota(self) -> None:
+        """Start the OTA update and follow its progress."""
+        await self._async_rpc_call(RPC_METHOD_START_OTA)
+
+        # Follow the status right away, the device reports the real state
+        # on the first poll or push
+        self._set_ota_field("state", "checking")
+        self._set_ota_field("progress", None)
+        self._async_publish()
+        self._async_track_ota()
 
     async def async_shutdown(self) -> None:
         """Shut down the coordinator."""
         _LOGGER.debug("Shutting down coordinator")
 
+        # Stop scheduled refreshes
+        await super().async_shutdown()
+        if self._unsub_scheduler is not None:
+            self._unsub_scheduler()
+            self._unsub_scheduler = None
+
+        # Stop following the OTA status
+        if self._ota_task:
+            self._ota_task.cancel()
+
+        # Drop setpoint writes not sent yet
+        if self._setpoint_task:
+            self._setpoint_task.cancel()
+        self._clear_optimistic_setpoint()
+
+        # Drop any publish waiting for its coalescing window
+        if self._publish_handle is not None:
+            self._publish_handle.cancel()
+            self._publish_handle = None
+
         # Stop the WebSocket task
         if self._ws_task:
             self._ws_task.cancel()
@@ -351,7 +1372,3 @@ class ACITThermACECCoordinator(DataUpdateCoordinator):
         # Close the WebSocket
         if self._ws and not self._ws.closed:
             await self._ws.close()
-
-        # Close the HTTP session
-        if self._session and not self._session.closed:
-            await self._session.close()
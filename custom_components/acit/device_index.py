@@ -0,0 +1,97 @@
+"""Index of the ACIT devices set up in Home Assistant."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .const import DATA_DEVICE_INDEX
+
+if TYPE_CHECKING:
+    from .coordinator import ACITThermACECCoordinator
+
+
+class ACITDeviceIndex:
+    """Coordinators indexed by device registry id and MAC address.
+
+    Entries add themselves once their device is registered and are removed
+    on unload, so resolving a service target never scans the device or
+    entity registries.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._by_device_id: dict[str, ACITThermACECCoordinator] = {}
+        self._by_mac: dict[str, ACITThermACECCoordinator] = {}
+
+    @callback
+    def async_add(
+        self, coordinator: ACITThermACECCoordinator, device_id: str
+    ) -> CALLBACK_TYPE:
+        """Index a coordinator, returning a callback to remove it."""
+        mac = dr.format_mac(coordinator.device_info.get("mac_address") or "")
+        self._by_device_id[device_id] = coordinator
+        if mac:
+            self._by_mac[mac] = coordinator
+
+        @callback
+        def _async_remove() -> None:
+            if self._by_device_id.get(device_id) is coordinator:
+                del self._by_device_id[device_id]
+            if mac and self._by_mac.get(mac) is coordinator:
+                del self._by_mac[mac]
+
+        return _async_remove
+
+    @property
+    def coordinators(self) -> list[ACITThermACECCoordinator]:
+        """Return every indexed coordinator."""
+        return list(self._by_device_id.values())
+
+    @callback
+    def async_get_by_device_id(self, device_id: str) -> ACITThermACECCoordinator | None:
+        """Return the coordinator of a device registry id."""
+        return self._by_device_id.get(device_id)
+
+    @callback
+    def async_get_by_mac(self, mac: str) -> ACITThermACECCoordinator | None:
+        """Return the coordinator of a device MAC address."""
+        return self._by_mac.get(dr.format_mac(mac))
+
+    @callback
+    def async_resolve(
+        self,
+        device_ids: Iterable[str] = (),
+        entity_ids: Iterable[str] = (),
+    ) -> list[ACITThermACECCoordinator]:
+        """Return the coordinators of the given devices and entities."""
+        matched: dict[str, ACITThermACECCoordinator] = {}
+
+        for device_id in device_ids:
+            if (coordinator := self._by_device_id.get(device_id)) is not None:
+                matched[device_id] = coordinator
+
+        if entity_ids:
+            entity_registry = er.async_get(self.hass)
+            for entity_id in entity_ids:
+                if (
+                    (entity := entity_registry.async_get(entity_id)) is not None
+                    and entity.device_id is not None
+                    and (coordinator := self._by_device_id.get(entity.device_id))
+                ):
+                    matched[entity.device_id] = coordinator
+
+        return list(matched.values())
+
+
+@callback
+def async_get_device_index(hass: HomeAssistant) -> ACITDeviceIndex:
+    """Return the device index shared by all ACIT config entries."""
+    index: ACITDeviceIndex | None = hass.data.get(DATA_DEVICE_INDEX)
+    if index is None:
+        index = hass.data[DATA_DEVICE_INDEX] = ACITDeviceIndex(hass)
+    return index
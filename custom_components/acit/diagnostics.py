@@ -0,0 +1,31 @@
+"""Diagnostics support for ACIT ThermACEC."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import ACITThermACECCoordinator
+from .scheduler import async_get_scheduler
+
+TO_REDACT = {CONF_HOST, CONF_NAME, "device_name", "mac_address", "unique_id", "title"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ACITThermACECCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "device_info": async_redact_data(coordinator.device_info, TO_REDACT),
+        "connection": coordinator.connection_info,
+        "data": coordinator.data.as_dict(),
+        "telemetry": coordinator.telemetry.as_dict(),
+        "scheduler": async_get_scheduler(hass).stats,
+    }
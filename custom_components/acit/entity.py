@@ -0,0 +1,32 @@
+"""Base entity for ACIT ThermACEC."""
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import ACITThermACECCoordinator
+
+
+class ACITEntity(CoordinatorEntity[ACITThermACECCoordinator]):
+    """Coordinator entity that only writes state when a field it renders changed."""
+
+    # Keys of coordinator.data rendered by the entity
+    _watched_keys: frozenset[str] = frozenset()
+    # NotifyStatus fields the entity is computed from
+    _status_fields: frozenset[str] = frozenset()
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the status fields the entity needs."""
+        await super().async_added_to_hass()
+        if self._status_fields:
+            self.async_on_remove(
+                self.coordinator.async_require_fields(self._status_fields)
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self.coordinator.changed_keys.isdisjoint(self._watched_keys):
+            return
+
+        super()._handle_coordinator_update()
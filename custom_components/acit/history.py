@@ -0,0 +1,227 @@
+"""Rolling statistics over recent ACIT device samples."""
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from .models import ACITRollingStats
+
+SECONDS_PER_HOUR = 3600
+
+
+class RollingWindow:
+    """Samples of one numeric field over a time window.
+
+    Samples are aggregated in buckets, each covering an equal slice of the
+    window, kept in fixed-size arrays used as a ring buffer. Slices last
+    `resolution` seconds, made longer when the window would need more than
+    `max_buckets` of them, so memory stays small for any window. A bucket holds the minimum, maximum, sum and count of its
+    samples, and its first and last samples, so the statistics are exact
+    however many samples arrive and the whole window always fits. The
+    aggregates are maintained incrementally as buckets enter and leave the
+    window: a running sum for the mean, and monotonic queues for the
+    minimum and maximum. Adding a sample is amortized O(1) and reading the
+    statistics is O(1).
+
+    The newest bucket never leaves the window, so a value that stopped
+    changing is still reported.
+    """
+
+    __slots__ = (
+        "_window",
+        "_capacity",
+        "_resolution",
+        "_first_times",
+        "_first_values",
+        "_last_times",
+        "_last_values",
+        "_mins",
+        "_maxs",
+        "_sums",
+        "_counts",
+        "_total",
+        "_size",
+        "_sum",
+        "_samples",
+        "_min_queue",
+        "_max_queue",
+    )
+
+    def __init__(self, window: float, resolution: float, max_buckets: int) -> None:
+        """Initialize an empty window of `window` seconds."""
+        self._window = window
+        # One bucket more than the window needs, for the partial oldest one
+        capacity = min(max_buckets, max(1, math.ceil(window / resolution))) + 1
+        self._capacity = capacity
+        self._resolution = window / (capacity - 1)
+        self._first_times = array("d", bytes(8 * capacity))
+        self._first_values = array("d", bytes(8 * capacity))
+        self._last_times = array("d", bytes(8 * capacity))
+        self._last_values = array("d", bytes(8 * capacity))
+        self._mins = array("d", bytes(8 * capacity))
+        self._maxs = array("d", bytes(8 * capacity))
+        self._sums = array("d", bytes(8 * capacity))
+        self._counts = array("q", bytes(8 * capacity))
+
+        # Buckets created so far, buckets in the window, and the sum and
+        # count of the samples in the window
+        self._total = 0
+        self._size = 0
+        self._sum = 0.0
+        self._samples = 0
+
+        # Sequence numbers of the buckets that can still hold the window
+        # minimum (minimums increasing) or maximum (maximums decreasing)
+        self._min_queue: deque[int] = deque()
+        self._max_queue: deque[int] = deque()
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample, evicting the buckets that left the window."""
+        if (
+            self._size
+            and timestamp - self._first_times[(self._total - 1) % self._capacity]
+            < self._resolution
+        ):
+            self._add_to_newest(timestamp, value)
+        else:
+            self._add_bucket(timestamp, value)
+
+        while (
+            self._size > 1
+            and self._last_times[(self._total - self._size) % self._capacity]
+            < timestamp - self._window
+        ):
+            self._evict_oldest()
+
+    def _add_bucket(self, timestamp: float, value: float) -> None:
+        """Start a new bucket with a sample."""
+        if self._size == self._capacity:
+            self._evict_oldest()
+
+        seq = self._total
+        slot = seq % self._capacity
+        self._first_times[slot] = self._last_times[slot] = timestamp
+        self._first_values[slot] = self._last_values[slot] = value
+        self._mins[slot] = self._maxs[slot] = self._sums[slot] = value
+        self._counts[slot] = 1
+        self._total += 1
+        self._size += 1
+        self._sum += value
+        self._samples += 1
+
+        while self._min_queue and self._mins[self._min_queue[-1] % self._capacity] >= value:
+            self._min_queue.pop()
+        self._min_queue.append(seq)
+        while self._max_queue and self._maxs[self._max_queue[-1] % self._capacity] <= value:
+            self._max_queue.pop()
+        self._max_queue.append(seq)
+
+        # The running sum drifts with floating point errors, sum it again
+        # once per lap of the ring
+        if slot == self._capacity - 1:
+            self._sum = self._window_sum()
+
+    def _add_to_newest(self, timestamp: float, value: float) -> None:
+        """Add a sample to the newest bucket."""
+        seq = self._total - 1
+        slot = seq % self._capacity
+        self._last_times[slot] = timestamp
+        self._last_values[slot] = value
+        self._sums[slot] += value
+        self._counts[slot] += 1
+        self._sum += value
+        self._samples += 1
+
+        # The newest bucket is last in both queues: requeue it when its
+        # minimum or maximum moves
+        if value < self._mins[slot]:
+            self._mins[slot] = value
+            while self._min_queue and self._mins[self._min_queue[-1] % self._capacity] >= value:
+                self._min_queue.pop()
+            self._min_queue.append(seq)
+        if value > self._maxs[slot]:
+            self._maxs[slot] = value
+            while self._max_queue and self._maxs[self._max_queue[-1] % self._capacity] <= value:
+                self._max_queue.pop()
+            self._max_queue.append(seq)
+
+    def _evict_oldest(self) -> None:
+        """Remove the oldest bucket from the window."""
+        seq = self._total - self._size
+        slot = seq % self._capacity
+        self._sum -= self._sums[slot]
+        self._samples -= self._counts[slot]
+        self._size -= 1
+        if self._min_queue[0] == seq:
+            self._min_queue.popleft()
+        if self._max_queue[0] == seq:
+            self._max_queue.popleft()
+
+    def _window_sum(self) -> float:
+        """Sum the values in the window exactly."""
+        start = (self._total - self._size) % self._capacity
+        end = start + self._size
+        if end <= self._capacity:
+            chunks = [self._sums[start:end]]
+        else:
+            chunks = [self._sums[start:], self._sums[: end - self._capacity]]
+
+        if np is not None:
+            return float(sum(np.frombuffer(chunk, dtype=np.float64).sum() for chunk in chunks))
+        return math.fsum(value for chunk in chunks for value in chunk)
+
+    def stats(self) -> ACITRollingStats:
+        """Return the statistics of the samples in the window."""
+        if not self._size:
+            return ACITRollingStats()
+
+        oldest = (self._total - self._size) % self._capacity
+        newest = (self._total - 1) % self._capacity
+        elapsed = self._last_times[newest] - self._first_times[oldest]
+        return ACITRollingStats(
+            min=self._mins[self._min_queue[0] % self._capacity],
+            max=self._maxs[self._max_queue[0] % self._capacity],
+            mean=self._sum / self._samples,
+            rate=(
+                (self._last_values[newest] - self._first_values[oldest])
+                / elapsed
+                * SECONDS_PER_HOUR
+                if elapsed > 0
+                else None
+            ),
+        )
+
+
+class TimeIntegral:
+    """Time integral of a sampled value.
+
+    The value is held from one sample to the next, however far apart, until
+    the integral is stopped, such as on a disconnection. Accumulation
+    resumes from the next sample.
+    """
+
+    __slots__ = ("_last_time", "_last_value", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty integral."""
+        self._last_time: float | None = None
+        self._last_value = 0.0
+        self.total = 0.0
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample, accumulating the interval since the previous one."""
+        self.stop(timestamp)
+        self._last_time = timestamp
+        self._last_value = value
+
+    def stop(self, timestamp: float) -> None:
+        """Hold the last value until timestamp, then wait for a new sample."""
+        if self._last_time is not None and timestamp > self._last_time:
+            self.total += self._last_value * (timestamp - self._last_time)
+        self._last_time = None
@@ -1,7 +1,7 @@
 """ACIT device model definitions."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from enum import StrEnum
 from typing import Any
 
@@ -47,6 +47,72 @@ class ACITModelConfig:
     supports_energy: bool
     default_features: list[ACITFeature]
     icon: str
+    # Heater power at 100 % heater level (W), for the energy estimate
+    rated_power: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ACITOTAState:
+    """OTA update state of an ACIT device."""
+
+    update_available: bool = False
+    available_version: str | None = None
+    state: str = "idle"
+    progress: int | None = None
+    channel: str = "stable"
+    size: int | None = None
+    mandatory: bool = False
+    release_url: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ACITRollingStats:
+    """Statistics of a device field over the recent history window."""
+
+    min: float | None = None
+    max: float | None = None
+    mean: float | None = None
+    # Change per hour between the oldest and newest samples of the window
+    rate: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ACITDeviceState:
+    """State of an ACIT device.
+
+    States are immutable: the coordinator publishes a new one for every
+    change, so any state handed out is a consistent snapshot that can be
+    kept across awaits.
+    """
+
+    available: bool = False
+
+    # Climate
+    temperature: float | None = None
+    target_temperature: float | None = None
+    heater_level: int | None = None
+    fan_speed: int | None = None
+
+    # Recent history
+    temperature_stats: ACITRollingStats = field(default_factory=ACITRollingStats)
+    heater_level_stats: ACITRollingStats = field(default_factory=ACITRollingStats)
+
+    # Heating totals: time at full heater power equivalent (h), and the
+    # matching energy at the rated power (kWh)
+    heater_duty_time: float | None = None
+    heater_energy: float | None = None
+
+    # Energy (EMS)
+    power: float | None = None
+    energy_import: float | None = None
+    energy_export: float | None = None
+    battery_level: int | None = None
+
+    ota: ACITOTAState = field(default_factory=ACITOTAState)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as a dict, for diagnostics."""
+        return asdict(self)
 
 
 # Model configurations
@@ -63,6 +129,7 @@ MODEL_CONFIGS: dict[str, ACITModelConfig] = {
             ACITFeature.FAN,
         ],
         icon="mdi:thermostat",
+        rated_power=2000,
     ),
     ACITModel.ACCUBLOC: ACITModelConfig(
         model=ACITModel.ACCUBLOC,
@@ -77,6 +144,7 @@ MODEL_CONFIGS: dict[str, ACITModelConfig] = {
             ACITFeature.FAN,
         ],
         icon="mdi:thermostat-box",
+        rated_power=2000,
     ),
     ACITModel.EMS: ACITModelConfig(
         model=ACITModel.EMS,
@@ -0,0 +1,182 @@
+"""Bulk onboarding of ACIT devices from address ranges and host lists."""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from .const import (
+    RPC_ENDPOINT,
+    RPC_METHOD_GET_CONFIG,
+    SCAN_CONNECT_TIMEOUT,
+    SCAN_MAX_WORKERS,
+    SCAN_TIMEOUT,
+)
+from .transport import async_get_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+_HOSTNAME = re.compile(r"^[A-Za-z0-9]([A-Za-z0-9.-]*[A-Za-z0-9])?$")
+_SEPARATORS = re.compile(r"[\s,;]+")
+
+
+@dataclass(frozen=True, slots=True)
+class ScannedDevice:
+    """An ACIT device that answered a scan."""
+
+    host: str
+    port: int
+    mac_address: str
+    model: str
+    version: str | None
+
+
+@dataclass(slots=True)
+class ScanResult:
+    """Outcome of a scan, devices found at several addresses counted once."""
+
+    scanned: int = 0
+    devices: list[ScannedDevice] = field(default_factory=list)
+    duplicates: int = 0
+
+    @property
+    def unreachable(self) -> int:
+        """Return the number of addresses without an ACIT device."""
+        return self.scanned - len(self.devices) - self.duplicates
+
+
+def _parse_target(target: str, default_port: int) -> Iterator[tuple[str, int]]:
+    """Expand one address, range or host of a host list."""
+    host, port = target, default_port
+    if target.startswith("["):
+        # [IPv6]:port
+        host, _, rest = target[1:].partition("]")
+        if rest:
+            port = int(rest.removeprefix(":"))
+    elif target.count(":") == 1:
+        host, _, port_text = target.partition(":")
+        port = int(port_text)
+    if not 0 < port < 65536:
+        raise ValueError(f"Invalid port: {target}")
+
+    if "/" in host:
+        network = ipaddress.ip_network(host, strict=False)
+        for address in network.hosts() if network.num_addresses > 1 else network:
+            yield str(address), port
+        return
+
+    try:
+        yield str(ipaddress.ip_address(host)), port
+    except ValueError:
+        if not _HOSTNAME.match(host):
+            raise ValueError(f"Invalid host: {target}") from None
+        yield host, port
+
+
+def parse_hosts(text: str, default_port: int, limit: int) -> list[tuple[str, int]]:
+    """Return the addresses of a list of ranges and hosts, in order.
+
+    The list holds CIDR ranges, IP addresses and host names, optionally
+    followed by a port, separated by commas or new lines. Lines starting
+    with # are ignored, so an exported manifest can be pasted as is. At most
+    limit + 1 addresses are expanded, so the caller can reject larger scans
+    without enumerating them.
+
+    Raises ValueError for an invalid entry.
+    """
+    targets = (
+        target
+        for line in text.splitlines()
+        if not line.lstrip().startswith("#")
+        for target in _SEPARATORS.split(line)
+        if target
+    )
+    addresses: dict[tuple[str, int], None] = {}
+    for target in targets:
+        for address in _parse_target(target, default_port):
+            addresses[address] = None
+            if len(addresses) > limit:
+                return list(addresses)
+    return list(addresses)
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession, host: str, port: int
+) -> ScannedDevice | None:
+    """Return the device answering at an address, if any."""
+    url = f"http://{host}:{port}{RPC_ENDPOINT}"
+    payload = {"jsonrpc": "2.0", "id": 1, "method": RPC_METHOD_GET_CONFIG, "params": {}}
+    try:
+        async with session.post(
+            url,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(
+                total=SCAN_TIMEOUT, sock_connect=SCAN_CONNECT_TIMEOUT
+            ),
+        ) as response:
+            if response.status != 200:
+                return None
+            result = await response.json(content_type=None)
+    except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
+        return None
+
+    if not isinstance(result, dict) or not isinstance(
+        config := result.get("result"), dict
+    ):
+        return None
+    return ScannedDevice(
+        host=host,
+        port=port,
+        mac_address=config.get("mac_address") or "",
+        model=config.get("model", "ThermACEC"),
+        version=config.get("version"),
+    )
+
+
+async def async_scan(hass: HomeAssistant, addresses: list[tuple[str, int]]) -> ScanResult:
+    """Probe addresses for ACIT devices.
+
+    At most SCAN_MAX_WORKERS addresses are probed at once, with a short
+    connect timeout, so that a range mostly made of empty addresses is
+    scanned in seconds. The probes do not hold request slots: these cap
+    the traffic of configured devices, not of addresses that may not
+    answer at all.
+    """
+    session = async_get_transport(hass).session
+    slots = asyncio.Semaphore(SCAN_MAX_WORKERS)
+
+    async def _async_probe_address(host: str, port: int) -> ScannedDevice | None:
+        async with slots:
+            return await _async_probe(session, host, port)
+
+    found = await asyncio.gather(
+        *(_async_probe_address(host, port) for host, port in addresses)
+    )
+
+    result = ScanResult(scanned=len(addresses))
+    seen: set[str] = set()
+    for device in found:
+        if device is None:
+            continue
+        # A device listed by name and by address answers twice
+        key = dr.format_mac(device.mac_address) if device.mac_address else device.host
+        if key in seen:
+            result.duplicates += 1
+            continue
+        seen.add(key)
+        result.devices.append(device)
+
+    _LOGGER.debug(
+        "Scanned %d addresses: %d devices found, %d duplicates",
+        result.scanned,
+        len(result.devices),
+        result.duplicates,
+    )
+    return result
@@ -0,0 +1,199 @@
+"""Fleet-wide OTA orchestration for ACIT devices."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import (
+    DOMAIN,
+    FLEET_MAX_CONCURRENT_CHECKS,
+    OTA_FAILED_STATES,
+    OTA_POLL_INTERVAL,
+    OTA_ROLLOUT_MAX_POLL_INTERVAL,
+    OTA_ROLLOUT_TIMEOUT,
+)
+from .coordinator import ACITThermACECCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Outcome of the update of one device during a rollout
+RESULT_UPDATED = "updated"
+RESULT_FAILED = "failed"
+RESULT_TIMEOUT = "timeout"
+
+# Reason a device with an update was left out of a rollout
+SKIPPED_UNLOADED = "unloaded"
+SKIPPED_UNAVAILABLE = "unavailable"
+SKIPPED_ABORTED = "aborted"
+
+
+def _describe(coordinator: ACITThermACECCoordinator) -> dict[str, Any]:
+    """Return how a device is identified in a fleet summary."""
+    return {
+        "device": coordinator.entry.data.get("device_name", coordinator.entry.title),
+        "entry_id": coordinator.entry.entry_id,
+        "installed_version": coordinator.device_info.get("version"),
+    }
+
+
+async def async_check_fleet(
+    coordinators: Iterable[ACITThermACECCoordinator],
+) -> dict[str, Any]:
+    """Check a set of devices for OTA updates concurrently.
+
+    At most FLEET_MAX_CONCURRENT_CHECKS checks run at once, on top of the
+    transport's own request limits.
+    """
+    coordinators = list(coordinators)
+    slots = asyncio.Semaphore(FLEET_MAX_CONCURRENT_CHECKS)
+
+    async def _async_check(coordinator: ACITThermACECCoordinator) -> bool:
+        async with slots:
+            return await coordinator.async_check_ota_update()
+
+    results = await asyncio.gather(*(_async_check(c) for c in coordinators))
+
+    summary: dict[str, Any] = {
+        "checked": len(coordinators),
+        "updates_available": [],
+        "failed": [],
+    }
+    for coordinator, checked in zip(coordinators, results, strict=True):
+        if not checked:
+            summary["failed"].append(_describe(coordinator))
+        elif coordinator.data.ota.update_available:
+            summary["updates_available"].append(
+                {
+                    **_describe(coordinator),
+                    "available_version": coordinator.data.ota.available_version,
+                }
+            )
+
+    _LOGGER.info(
+        "OTA check of %d devices: %d updates available, %d failed",
+        summary["checked"],
+        len(summary["updates_available"]),
+        len(summary["failed"]),
+    )
+    return summary
+
+
+async def _async_install(hass: HomeAssistant, entry_id: str) -> str:
+    """Update one device and wait until it runs the new firmware.
+
+    The device is healthy once its configuration reports a new firmware
+    version. It failed if its OTA state reports an error, if it went back
+    to idle on the same version, or if it is not back on a new version
+    within OTA_ROLLOUT_TIMEOUT. The entry is reloaded when the new version
+    is seen, so the coordinator is looked up again on every check.
+    """
+    coordinator: ACITThermACECCoordinator | None = hass.data[DOMAIN].get(entry_id)
+    if coordinator is None:
+        # Unloaded since the check
+        return RESULT_FAILED
+    previous_version = coordinator.device_info.get("version")
+
+    try:
+        await coordinator.async_start_ota()
+    except UpdateFailed as err:
+        _LOGGER.warning("Unable to start OTA update of %s: %s", coordinator.entry.title, err)
+        return RESULT_FAILED
+
+    delay = OTA_POLL_INTERVAL
+    try:
+        async with asyncio.timeout(OTA_ROLLOUT_TIMEOUT):
+            while True:
+                await asyncio.sleep(delay)
+
+                # Missing while the entry reloads on the new firmware
+                if (coordinator := hass.data[DOMAIN].get(entry_id)) is None:
+                    continue
+
+                if coordinator.device_info.get("version") != previous_version:
+                    return RESULT_UPDATED
+
+                if coordinator.data.ota.state in OTA_FAILED_STATES:
+                    return RESULT_FAILED
+
+                # Update no longer running: wait for the device to come back
+                # on the new firmware, checking less and less often
+                if not coordinator.ota_in_progress:
+                    if (
+                        await coordinator.async_revalidate_device_config()
+                        and coordinator.device_info.get("version") == previous_version
+                        and coordinator.data.ota.state == "idle"
+                    ):
+                        return RESULT_FAILED
+                    delay = min(delay * 2, OTA_ROLLOUT_MAX_POLL_INTERVAL)
+    except TimeoutError:
+        return RESULT_TIMEOUT
+
+
+async def async_rollout(
+    hass: HomeAssistant,
+    coordinators: Iterable[ACITThermACECCoordinator],
+    max_concurrent: int,
+    max_failures: int,
+) -> dict[str, Any]:
+    """Install available OTA updates across a set of devices in waves.
+
+    The devices are checked first, then those with an update are updated
+    max_concurrent at a time, which bounds the number of simultaneous
+    firmware downloads. Each wave must finish before the next one starts,
+    and the rollout stops once more than max_failures devices failed; the
+    devices left are reported as skipped. Devices with an update that are
+    unavailable, or whose entry unloaded during the check, are skipped too.
+    """
+    check = await async_check_fleet(coordinators)
+
+    summary: dict[str, Any] = {
+        RESULT_UPDATED: [],
+        RESULT_FAILED: [],
+        "skipped": [],
+        "aborted": False,
+    }
+    failures = 0
+
+    pending: list[dict[str, Any]] = []
+    for item in check["updates_available"]:
+        if (coordinator := hass.data[DOMAIN].get(item["entry_id"])) is None:
+            summary["skipped"].append({**item, "reason": SKIPPED_UNLOADED})
+        elif not coordinator.data.available:
+            summary["skipped"].append({**item, "reason": SKIPPED_UNAVAILABLE})
+        else:
+            pending.append(item)
+
+    for start in range(0, len(pending), max_concurrent):
+        wave = pending[start : start + max_concurrent]
+        results = await asyncio.gather(
+            *(_async_install(hass, item["entry_id"]) for item in wave)
+        )
+
+        for item, result in zip(wave, results, strict=True):
+            if result == RESULT_UPDATED:
+                summary[RESULT_UPDATED].append(item)
+            else:
+                failures += 1
+                summary[RESULT_FAILED].append({**item, "reason": result})
+
+        if failures > max_failures:
+            summary["aborted"] = True
+            summary["skipped"].extend(
+                {**item, "reason": SKIPPED_ABORTED}
+                for item in pending[start + max_concurrent :]
+            )
+            break
+
+    _LOGGER.info(
+        "OTA rollout: %d updated, %d failed, %d skipped%s",
+        len(summary[RESULT_UPDATED]),
+        len(summary[RESULT_FAILED]),
+        len(summary["skipped"]),
+        " (aborted)" if summary["aborted"] else "",
+    )
+    return summary
@@ -0,0 +1,160 @@
+"""Fleet-wide poll scheduler for ACIT devices."""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    DATA_SCHEDULER,
+    DOMAIN,
+    SCHEDULER_MAX_CONCURRENT_POLLS,
+    UPDATE_INTERVAL,
+)
+from .transport import async_get_transport
+
+if TYPE_CHECKING:
+    from .coordinator import ACITThermACECCoordinator
+
+
+class ACITScheduler:
+    """Poll scheduler shared by every ACIT coordinator.
+
+    Coordinators have no update interval of their own. The scheduler walks
+    the fleet round-robin instead, giving each coordinator an evenly spaced
+    slot within UPDATE_INTERVAL, and polls those without a healthy push
+    connection. At most SCHEDULER_MAX_CONCURRENT_POLLS polls run at once;
+    the others queue, and the time they spend queued is reported as lag.
+
+    The timer stops while no coordinator needs polling, and is restarted by
+    a coordinator losing its push connection.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._coordinators: list[ACITThermACECCoordinator] = []
+        self._cursor = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._next_tick = 0.0
+
+        self._poll_slots = asyncio.Semaphore(SCHEDULER_MAX_CONCURRENT_POLLS)
+        self._polling: set[ACITThermACECCoordinator] = set()
+
+        # Polls waiting for a slot, polls running, and queueing delay (seconds)
+        self.queue_depth = 0
+        self.polls_in_flight = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    @callback
+    def async_register(self, coordinator: ACITThermACECCoordinator) -> CALLBACK_TYPE:
+        """Add a coordinator to the schedule, returning a callback to remove it."""
+        self._coordinators.append(coordinator)
+        self.async_wake()
+
+        @callback
+        def _async_unregister() -> None:
+            self._coordinators.remove(coordinator)
+            if not self._coordinators and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        return _async_unregister
+
+    @callback
+    def async_wake(self) -> None:
+        """Restart the poll slots if they were stopped."""
+        if self._timer is None and self._coordinators:
+            self._next_tick = self.hass.loop.time()
+            self._async_schedule_tick()
+
+    @property
+    def slot_interval(self) -> float:
+        """Return the time between two consecutive poll slots."""
+        return UPDATE_INTERVAL / max(len(self._coordinators), 1)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the scheduler and transport load."""
+        transport = async_get_transport(self.hass)
+        return {
+            "devices": len(self._coordinators),
+            "devices_polled": sum(
+                1 for coordinator in self._coordinators if coordinator.needs_poll
+            ),
+            "slot_interval": round(self.slot_interval, 3),
+            "queue_depth": self.queue_depth,
+            "polls_in_flight": self.polls_in_flight,
+            "last_lag": round(self.last_lag, 3),
+            "max_lag": round(self.max_lag, 3),
+            "requests_waiting": transport.requests_waiting,
+            "requests_in_flight": transport.requests_in_flight,
+        }
+
+    @callback
+    def _async_schedule_tick(self) -> None:
+        """Schedule the next poll slot."""
+        # Do not try to catch up on slots missed while the loop was busy
+        self._next_tick = max(
+            self._next_tick + self.slot_interval, self.hass.loop.time()
+        )
+        self._timer = self.hass.loop.call_at(self._next_tick, self._async_tick)
+
+    @callback
+    def _async_tick(self) -> None:
+        """Poll the next coordinator of the round, if it needs it."""
+        self._timer = None
+        if not self._coordinators:
+            return
+
+        self._cursor %= len(self._coordinators)
+        coordinator = self._coordinators[self._cursor]
+        self._cursor += 1
+
+        if coordinator.needs_poll and coordinator not in self._polling:
+            self._polling.add(coordinator)
+            coordinator.entry.async_create_background_task(
+                self.hass,
+                self._async_poll(coordinator, self.hass.loop.time()),
+                f"{DOMAIN} scheduled poll",
+            )
+
+        # Every device pushes its status: wait for one to need polling
+        if not any(coordinator.needs_poll for coordinator in self._coordinators):
+            return
+
+        self._async_schedule_tick()
+
+    async def _async_poll(
+        self, coordinator: ACITThermACECCoordinator, slot_time: float
+    ) -> None:
+        """Refresh a coordinator once a poll slot is free."""
+        self.queue_depth += 1
+        acquired = False
+        try:
+            async with self._poll_slots:
+                self.queue_depth -= 1
+                acquired = True
+                self.last_lag = self.hass.loop.time() - slot_time
+                self.max_lag = max(self.max_lag, self.last_lag)
+
+                self.polls_in_flight += 1
+                try:
+                    await coordinator.async_refresh()
+                finally:
+                    self.polls_in_flight -= 1
+        finally:
+            if not acquired:
+                self.queue_depth -= 1
+            self._polling.discard(coordinator)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> ACITScheduler:
+    """Return the scheduler shared by all ACIT config entries."""
+    scheduler: ACITScheduler | None = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_SCHEDULER] = ACITScheduler(hass)
+    return scheduler
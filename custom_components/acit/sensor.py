@@ -4,9 +4,9 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -15,18 +15,21 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     UnitOfEnergy,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ACITThermACECCoordinator
-from .models import ACITFeature
+from .entity import ACITEntity
+from .models import ACITDeviceState, ACITFeature
+from .telemetry import ACITTelemetry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,9 +38,29 @@ _LOGGER = logging.getLogger(__name__)
 class ACITSensorEntityDescription(SensorEntityDescription):
     """Describes ACIT sensor entity."""
 
-    exists_fn: Callable[[dict[str, Any]], bool] = lambda _: True
-    value_fn: Callable[[dict[str, Any]], StateType]
+    exists_fn: Callable[[ACITDeviceState], bool] = lambda _: True
+    value_fn: Callable[[ACITDeviceState], StateType]
     required_feature: ACITFeature | None = None
+    # Key of coordinator.data the value comes from, when it differs from key
+    data_key: str | None = None
+    # Total accumulated by the coordinator, resumed from the last state
+    restore: bool = False
+    # NotifyStatus field the value is computed from
+    status_field: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ACITTelemetrySensorEntityDescription(SensorEntityDescription):
+    """Describes ACIT transport telemetry sensor entity."""
+
+    value_fn: Callable[[ACITTelemetry], StateType]
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert a latency to milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
 
 
 # Definition of all available sensors
@@ -50,9 +73,9 @@ SENSORS: tuple[ACITSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
-        exists_fn=lambda data: data.get("temperature") is not None,
-        value_fn=lambda data: data.get("temperature"),
+        value_fn=lambda data: data.temperature,
         required_feature=ACITFeature.TEMPERATURE,
+        status_field="temperature",
     ),
     ACITSensorEntityDescription(
         key="target_temperature",
@@ -61,27 +84,141 @@ SENSORS: tuple[ACITSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
-        exists_fn=lambda data: data.get("target_temperature") is not None,
-        value_fn=lambda data: data.get("target_temperature"),
+        value_fn=lambda data: data.target_temperature,
         required_feature=ACITFeature.TARGET_TEMPERATURE,
+        status_field="target_temperature",
     ),
     ACITSensorEntityDescription(
         key="heater_level",
         translation_key="heater_level",
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
-        exists_fn=lambda data: data.get("heater_level") is not None,
-        value_fn=lambda data: data.get("heater_level"),
+        value_fn=lambda data: data.heater_level,
         required_feature=ACITFeature.HEATING,
+        status_field="heater_level",
     ),
     ACITSensorEntityDescription(
         key="fan_speed",
         translation_key="fan_speed",
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
-        exists_fn=lambda data: data.get("fan_speed") is not None,
-        value_fn=lambda data: data.get("fan_speed"),
+        value_fn=lambda data: data.fan_speed,
         required_feature=ACITFeature.FAN,
+        status_field="fan_speed",
+    ),
+    # Rolling statistics over the history window
+    ACITSensorEntityDescription(
+        key="temperature_min",
+        translation_key="temperature_min",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda data: data.temperature_stats.min,
+        required_feature=ACITFeature.TEMPERATURE,
+        data_key="temperature_stats",
+        status_field="temperature",
+    ),
+    ACITSensorEntityDescription(
+        key="temperature_max",
+        translation_key="temperature_max",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda data: data.temperature_stats.max,
+        required_feature=ACITFeature.TEMPERATURE,
+        data_key="temperature_stats",
+        status_field="temperature",
+    ),
+    ACITSensorEntityDescription(
+        key="temperature_mean",
+        translation_key="temperature_mean",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda data: data.temperature_stats.mean,
+        required_feature=ACITFeature.TEMPERATURE,
+        data_key="temperature_stats",
+        status_field="temperature",
+    ),
+    ACITSensorEntityDescription(
+        key="temperature_rate",
+        translation_key="temperature_rate",
+        native_unit_of_measurement=f"{UnitOfTemperature.CELSIUS}/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda data: data.temperature_stats.rate,
+        required_feature=ACITFeature.TEMPERATURE,
+        data_key="temperature_stats",
+        status_field="temperature",
+    ),
+    ACITSensorEntityDescription(
+        key="heater_level_min",
+        translation_key="heater_level_min",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda data: data.heater_level_stats.min,
+        required_feature=ACITFeature.HEATING,
+        data_key="heater_level_stats",
+        status_field="heater_level",
+    ),
+    ACITSensorEntityDescription(
+        key="heater_level_max",
+        translation_key="heater_level_max",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda data: data.heater_level_stats.max,
+        required_feature=ACITFeature.HEATING,
+        data_key="heater_level_stats",
+        status_field="heater_level",
+    ),
+    ACITSensorEntityDescription(
+        key="heater_level_mean",
+        translation_key="heater_level_mean",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda data: data.heater_level_stats.mean,
+        required_feature=ACITFeature.HEATING,
+        data_key="heater_level_stats",
+        status_field="heater_level",
+    ),
+    ACITSensorEntityDescription(
+        key="heater_level_rate",
+        translation_key="heater_level_rate",
+        native_unit_of_measurement="/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda data: data.heater_level_stats.rate,
+        required_feature=ACITFeature.HEATING,
+        data_key="heater_level_stats",
+        status_field="heater_level",
+    ),
+    # Heating totals, integrated from the heater level
+    ACITSensorEntityDescription(
+        key="heater_duty_time",
+        translation_key="heater_duty_time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=2,
+        value_fn=lambda data: data.heater_duty_time,
+        required_feature=ACITFeature.HEATING,
+        restore=True,
+        status_field="heater_level",
+    ),
+    ACITSensorEntityDescription(
+        key="heater_energy",
+        translation_key="heater_energy",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=2,
+        value_fn=lambda data: data.heater_energy,
+        required_feature=ACITFeature.HEATING,
+        restore=True,
+        status_field="heater_level",
     ),
     # Energy sensors (EMS)
     ACITSensorEntityDescription(
@@ -91,8 +228,7 @@ SENSORS: tuple[ACITSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
-        exists_fn=lambda data: data.get("power") is not None,
-        value_fn=lambda data: data.get("power"),
+        value_fn=lambda data: data.power,
         required_feature=ACITFeature.POWER_MONITORING,
     ),
     ACITSensorEntityDescription(
@@ -102,8 +238,7 @@ SENSORS: tuple[ACITSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=2,
-        exists_fn=lambda data: data.get("energy_import") is not None,
-        value_fn=lambda data: data.get("energy_import"),
+        value_fn=lambda data: data.energy_import,
         required_feature=ACITFeature.ENERGY_IMPORT,
     ),
     ACITSensorEntityDescription(
@@ -113,8 +248,7 @@ SENSORS: tuple[ACITSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=2,
-        exists_fn=lambda data: data.get("energy_export") is not None,
-        value_fn=lambda data: data.get("energy_export"),
+        value_fn=lambda data: data.energy_export,
         required_feature=ACITFeature.ENERGY_EXPORT,
     ),
     ACITSensorEntityDescription(
@@ -124,12 +258,65 @@ SENSORS: tuple[ACITSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
-        exists_fn=lambda data: data.get("battery_level") is not None,
-        value_fn=lambda data: data.get("battery_level"),
+        value_fn=lambda data: data.battery_level,
         required_feature=ACITFeature.BATTERY,
     ),
 )
 
+# Transport telemetry, for every device
+TELEMETRY_SENSORS: tuple[ACITTelemetrySensorEntityDescription, ...] = (
+    ACITTelemetrySensorEntityDescription(
+        key="rpc_latency_mean",
+        translation_key="rpc_latency_mean",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda telemetry: _ms(telemetry.latency.mean),
+    ),
+    ACITTelemetrySensorEntityDescription(
+        key="rpc_latency_p95",
+        translation_key="rpc_latency_p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda telemetry: _ms(telemetry.latency.quantile(0.95)),
+    ),
+    ACITTelemetrySensorEntityDescription(
+        key="rpc_errors",
+        translation_key="rpc_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda telemetry: telemetry.rpc_error_count,
+    ),
+    ACITTelemetrySensorEntityDescription(
+        key="consecutive_errors",
+        translation_key="consecutive_errors",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda telemetry: telemetry.consecutive_errors,
+    ),
+    ACITTelemetrySensorEntityDescription(
+        key="ws_messages",
+        translation_key="ws_messages",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda telemetry: telemetry.ws_messages,
+    ),
+    ACITTelemetrySensorEntityDescription(
+        key="ws_reconnects",
+        translation_key="ws_reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda telemetry: telemetry.ws_reconnects,
+    ),
+    ACITTelemetrySensorEntityDescription(
+        key="push_ratio",
+        translation_key="push_ratio",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda telemetry: telemetry.push_ratio,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -144,8 +331,9 @@ async def async_setup_entry(
     supported_features = get_supported_features(coordinator.device_info)
 
     _LOGGER.debug(
-        f"Setting up sensors for {coordinator.device_info.get('model')} "
-        f"with features: {supported_features}"
+        "Setting up sensors for %s with features: %s",
+        coordinator.device_info.get("model"),
+        supported_features,
     )
 
     # Create entities based on supported features
@@ -155,18 +343,28 @@ async def async_setup_entry(
         if description.required_feature is not None:
             if description.required_feature not in supported_features:
                 _LOGGER.debug(
-                    f"Sensor {description.key} skipped (feature {description.required_feature} not supported)"
+                    "Sensor %s skipped (feature %s not supported)",
+                    description.key,
+                    description.required_feature,
                 )
                 continue
 
-        # Check if data exists
+        # Check if the sensor applies to this device
         if description.exists_fn(coordinator.data):
-            entities.append(ACITSensorEntity(coordinator, entry, description))
+            entity_class = (
+                ACITRestoreSensorEntity if description.restore else ACITSensorEntity
+            )
+            entities.append(entity_class(coordinator, entry, description))
+
+    entities.extend(
+        ACITTelemetrySensorEntity(coordinator, entry, description)
+        for description in TELEMETRY_SENSORS
+    )
 
     async_add_entities(entities)
 
 
-class ACITSensorEntity(CoordinatorEntity, SensorEntity):
+class ACITSensorEntity(ACITEntity, SensorEntity):
     """Represents an ACIT ThermACEC sensor."""
 
     entity_description: ACITSensorEntityDescription
@@ -181,6 +379,11 @@ class ACITSensorEntity(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = entity_description
+        self._watched_keys = frozenset(
+            {entity_description.data_key or entity_description.key, "available"}
+        )
+        if entity_description.status_field is not None:
+            self._status_fields = frozenset({entity_description.status_field})
 
         device_info = coordinator.device_info
         mac_address = device_info.get("mac_address", entry.entry_id)
@@ -203,7 +406,71 @@ class ACITSensorEntity(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return whether the entity is available."""
         return (
-            self.coordinator.data.get("available", False)
+            self.coordinator.data.available
             and self.native_value is not None
         )
 
+
+class ACITRestoreSensorEntity(ACITSensorEntity, RestoreSensor):
+    """ACIT sensor of a coordinator total that carries on across restarts."""
+
+    async def async_added_to_hass(self) -> None:
+        """Resume the coordinator total from the last state."""
+        await super().async_added_to_hass()
+        if (last_data := await self.async_get_last_sensor_data()) is None:
+            return
+
+        try:
+            value = float(last_data.native_value)
+        except (TypeError, ValueError):
+            return
+
+        self.coordinator.async_restore_heater_total(self.entity_description.key, value)
+
+
+class ACITTelemetrySensorEntity(ACITEntity, SensorEntity):
+    """Diagnostic sensor of the transport telemetry of an ACIT device.
+
+    Telemetry changes with every message and is never published by the
+    coordinator, so these sensors are polled at the platform scan interval
+    instead.
+    """
+
+    entity_description: ACITTelemetrySensorEntityDescription
+    _attr_has_entity_name = True
+    _watched_keys = frozenset({"available"})
+
+    def __init__(
+        self,
+        coordinator: ACITThermACECCoordinator,
+        entry: ConfigEntry,
+        entity_description: ACITTelemetrySensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+
+        device_info = coordinator.device_info
+        mac_address = device_info.get("mac_address", entry.entry_id)
+
+        self._attr_unique_id = f"{mac_address}_{entity_description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, mac_address)},
+            "name": entry.data.get("device_name", "ACIT ThermACEC"),
+            "manufacturer": device_info.get("manufacturer", "ACIT"),
+            "model": device_info.get("model", "ThermACEC"),
+            "sw_version": device_info.get("version", "Unavailable"),
+        }
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll to pick up the latest counters."""
+        return True
+
+    async def async_update(self) -> None:
+        """Read the counters when the state is written, without a device refresh."""
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the sensor value."""
+        return self.entity_description.value_fn(self.coordinator.telemetry)
@@ -0,0 +1,128 @@
+"""Services for the ACIT ThermACEC integration."""
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import (
+    ATTR_MAX_CONCURRENT,
+    ATTR_MAX_FAILURES,
+    ATTR_MODEL,
+    DEFAULT_ROLLOUT_MAX_CONCURRENT,
+    DEFAULT_ROLLOUT_MAX_FAILURES,
+    DOMAIN,
+    MAX_ROLLOUT_MAX_CONCURRENT,
+    SERVICE_CHECK_UPDATE,
+    SERVICE_CHECK_UPDATE_ALL,
+    SERVICE_INSTALL_UPDATE_ALL,
+)
+from .coordinator import ACITThermACECCoordinator
+from .device_index import async_get_device_index
+from .ota import async_check_fleet, async_rollout
+
+_LOGGER = logging.getLogger(__name__)
+
+TARGET_KEYS = tuple(str(key) for key in cv.TARGET_SERVICE_FIELDS)
+
+TARGET_SCHEMA = vol.Schema(cv.TARGET_SERVICE_FIELDS)
+CHECK_UPDATE_SCHEMA = vol.All(TARGET_SCHEMA, cv.has_at_least_one_key(*TARGET_KEYS))
+CHECK_UPDATE_ALL_SCHEMA = TARGET_SCHEMA.extend(
+    {vol.Optional(ATTR_MODEL): vol.All(cv.ensure_list, [cv.string])}
+)
+INSTALL_UPDATE_ALL_SCHEMA = CHECK_UPDATE_ALL_SCHEMA.extend(
+    {
+        vol.Optional(
+            ATTR_MAX_CONCURRENT, default=DEFAULT_ROLLOUT_MAX_CONCURRENT
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_ROLLOUT_MAX_CONCURRENT)),
+        vol.Optional(
+            ATTR_MAX_FAILURES, default=DEFAULT_ROLLOUT_MAX_FAILURES
+        ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+
+@callback
+def _async_get_targets(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[ACITThermACECCoordinator]:
+    """Return the coordinators targeted by a service call.
+
+    Calls without any target apply to the whole fleet, then the devices
+    are filtered by model when requested.
+    """
+    index = async_get_device_index(hass)
+    if any(key in call.data for key in TARGET_KEYS):
+        selected = async_extract_referenced_entity_ids(hass, call)
+        coordinators = index.async_resolve(
+            device_ids=selected.referenced_devices,
+            entity_ids=selected.referenced | selected.indirectly_referenced,
+        )
+    else:
+        coordinators = index.coordinators
+
+    if models := call.data.get(ATTR_MODEL):
+        coordinators = [
+            coordinator
+            for coordinator in coordinators
+            if coordinator.device_info.get("model") in models
+        ]
+
+    return coordinators
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the ACIT services."""
+
+    async def async_check_update(call: ServiceCall) -> ServiceResponse:
+        """Service to manually check the targeted devices for OTA updates."""
+        coordinators = _async_get_targets(hass, call)
+        if not coordinators:
+            _LOGGER.error("No ACIT device matches the check_update target")
+
+        return await async_check_fleet(coordinators)
+
+    async def async_check_update_all(call: ServiceCall) -> ServiceResponse:
+        """Service to check every device for OTA updates."""
+        return await async_check_fleet(_async_get_targets(hass, call))
+
+    async def async_install_update_all(call: ServiceCall) -> ServiceResponse:
+        """Service to roll out available OTA updates across the fleet."""
+        return await async_rollout(
+            hass,
+            _async_get_targets(hass, call),
+            call.data[ATTR_MAX_CONCURRENT],
+            call.data[ATTR_MAX_FAILURES],
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CHECK_UPDATE,
+        async_check_update,
+        schema=CHECK_UPDATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CHECK_UPDATE_ALL,
+        async_check_update_all,
+        schema=CHECK_UPDATE_ALL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_INSTALL_UPDATE_ALL,
+        async_install_update_all,
+        schema=INSTALL_UPDATE_ALL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,211 @@
+"""Transport telemetry of an ACIT device."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Any
+
+from .const import RPC_LATENCY_BUCKETS, TRACE_LATENCY_BUCKETS
+
+
+class LatencyHistogram:
+    """Latencies counted in fixed buckets.
+
+    Recording is O(log buckets) and the memory does not grow with the
+    number of samples. Quantiles are reported as the upper bound of the
+    bucket they fall in.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: tuple[float, ...] = RPC_LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram with the given bucket upper bounds."""
+        self.bounds = bounds
+        # One bucket per bound, plus one for latencies above the last bound
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, latency: float) -> None:
+        """Record a latency (seconds)."""
+        self.counts[bisect_left(self.bounds, latency)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add the samples of another histogram."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean latency (seconds)."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, fraction: float) -> float | None:
+        """Return an upper bound of a latency quantile (seconds)."""
+        if not self.count:
+            return None
+
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in milliseconds, for diagnostics."""
+
+        def _ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 3)
+
+        labels = [f"<={bound * 1000:g}ms" for bound in self.bounds]
+        labels.append(f">{self.bounds[-1] * 1000:g}ms")
+        return {
+            "count": self.count,
+            "mean_ms": _ms(self.mean),
+            "p50_ms": _ms(self.quantile(0.5)),
+            "p95_ms": _ms(self.quantile(0.95)),
+            "max_ms": _ms(self.max),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class ACITTelemetry:
+    """Always-on counters of the exchanges with one device.
+
+    Everything is a plain integer increment or a histogram insert, cheap
+    enough for the message path. Nothing is published to listeners: the
+    diagnostic sensors and the diagnostics download read it when needed.
+    """
+
+    __slots__ = (
+        "rpc_latency",
+        "rpc_errors",
+        "rpc_over_ws",
+        "rpc_over_http",
+        "consecutive_errors",
+        "ws_attempts",
+        "ws_connections",
+        "ws_failures",
+        "ws_messages",
+        "status_pushes",
+        "status_polls",
+        "status_probes",
+        "trace",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        # RPC calls: latency histogram and failures per method, transport
+        # used, and failures since the last successful call
+        self.rpc_latency: dict[str, LatencyHistogram] = {}
+        self.rpc_errors: Counter[str] = Counter()
+        self.rpc_over_ws = 0
+        self.rpc_over_http = 0
+        self.consecutive_errors = 0
+
+        # WebSocket: connection attempts, connections established, attempts
+        # that failed or closed too soon, and messages received
+        self.ws_attempts = 0
+        self.ws_connections = 0
+        self.ws_failures = 0
+        self.ws_messages = 0
+
+        # Status updates by source: NotifyStatus, scheduled polls, and
+        # resynchronization of a new WebSocket
+        self.status_pushes = 0
+        self.status_polls = 0
+        self.status_probes = 0
+
+        # Sampled NotifyStatus frames, by stage: decoding, merging into the
+        # device state, and reception to listeners notified
+        self.trace = {
+            stage: LatencyHistogram(TRACE_LATENCY_BUCKETS)
+            for stage in ("parse", "merge", "publish")
+        }
+
+    def record_rpc(self, method: str, latency: float, success: bool) -> None:
+        """Record the outcome of an RPC call."""
+        if (histogram := self.rpc_latency.get(method)) is None:
+            histogram = self.rpc_latency[method] = LatencyHistogram()
+        histogram.add(latency)
+
+        if success:
+            self.consecutive_errors = 0
+        else:
+            self.rpc_errors[method] += 1
+            self.consecutive_errors += 1
+
+    @property
+    def rpc_calls(self) -> int:
+        """Return the number of RPC calls made."""
+        return sum(histogram.count for histogram in self.rpc_latency.values())
+
+    @property
+    def rpc_error_count(self) -> int:
+        """Return the number of RPC calls that failed."""
+        return sum(self.rpc_errors.values())
+
+    @property
+    def latency(self) -> LatencyHistogram:
+        """Return the latencies of every RPC method together."""
+        total = LatencyHistogram()
+        for histogram in self.rpc_latency.values():
+            total.merge(histogram)
+        return total
+
+    @property
+    def ws_reconnects(self) -> int:
+        """Return the number of WebSocket connections after the first one."""
+        return max(self.ws_connections - 1, 0)
+
+    @property
+    def push_ratio(self) -> float | None:
+        """Return the share of status updates pushed by the device (%)."""
+        updates = self.status_pushes + self.status_polls + self.status_probes
+        return round(100 * self.status_pushes / updates, 1) if updates else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters, for diagnostics."""
+        return {
+            "rpc": {
+                "calls": self.rpc_calls,
+                "errors": self.rpc_error_count,
+                "consecutive_errors": self.consecutive_errors,
+                "over_websocket": self.rpc_over_ws,
+                "over_http": self.rpc_over_http,
+                "latency": self.latency.as_dict(),
+                "methods": {
+                    method: {
+                        **histogram.as_dict(),
+                        "errors": self.rpc_errors[method],
+                    }
+                    for method, histogram in sorted(self.rpc_latency.items())
+                },
+            },
+            "websocket": {
+                "attempts": self.ws_attempts,
+                "connections": self.ws_connections,
+                "reconnects": self.ws_reconnects,
+                "failures": self.ws_failures,
+                "messages": self.ws_messages,
+            },
+            "status_updates": {
+                "pushed": self.status_pushes,
+                "polled": self.status_polls,
+                "probed": self.status_probes,
+                "push_ratio": self.push_ratio,
+            },
+            "trace": {
+                stage: histogram.as_dict()
+                for stage, histogram in self.trace.items()
+                if histogram.count
+            },
+        }
@@ -0,0 +1,98 @@
+"""Shared HTTP transport for ACIT devices."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DATA_TRANSPORT,
+    TRANSPORT_MAX_CONCURRENT_HANDSHAKES,
+    TRANSPORT_MAX_CONCURRENT_PROBES,
+    TRANSPORT_MAX_CONCURRENT_REQUESTS,
+    TRANSPORT_MAX_REQUESTS_PER_HOST,
+)
+
+
+class ACITTransport:
+    """Transport shared by every ACIT coordinator and config flow.
+
+    All traffic goes through Home Assistant's pooled client session, so
+    keep-alive connections and the DNS cache are reused per host instead of
+    being duplicated per device. Request slots cap the number of sockets the
+    fleet opens at once, both globally and per device (host and port, so
+    devices behind one address are not serialized), and handshake slots
+    cap concurrent WebSocket handshakes so a fleet recovering from an outage
+    reconnects as a ramp rather than all at once. Probe slots do the same for
+    devices discovered on the network.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the transport."""
+        self.session: aiohttp.ClientSession = async_get_clientsession(hass)
+        self._global_slots = asyncio.Semaphore(TRANSPORT_MAX_CONCURRENT_REQUESTS)
+        # Per-device slots, with the requests holding or waiting on each
+        self._host_slots: dict[tuple[str, int], asyncio.Semaphore] = {}
+        self._host_users: dict[tuple[str, int], int] = {}
+        self._handshake_slots = asyncio.Semaphore(TRANSPORT_MAX_CONCURRENT_HANDSHAKES)
+        self._probe_slots = asyncio.Semaphore(TRANSPORT_MAX_CONCURRENT_PROBES)
+
+        # Requests waiting for a slot, and requests holding one
+        self.requests_waiting = 0
+        self.requests_in_flight = 0
+
+    @asynccontextmanager
+    async def request_slot(self, host: str, port: int) -> AsyncIterator[None]:
+        """Hold a request slot for a device for the duration of the block."""
+        key = (host, port)
+        host_slot = self._host_slots.get(key)
+        if host_slot is None:
+            host_slot = self._host_slots[key] = asyncio.Semaphore(
+                TRANSPORT_MAX_REQUESTS_PER_HOST
+            )
+        self._host_users[key] = self._host_users.get(key, 0) + 1
+
+        self.requests_waiting += 1
+        acquired = False
+        try:
+            async with host_slot, self._global_slots:
+                self.requests_waiting -= 1
+                self.requests_in_flight += 1
+                acquired = True
+                try:
+                    yield
+                finally:
+                    self.requests_in_flight -= 1
+        finally:
+            if not acquired:
+                self.requests_waiting -= 1
+            # Forget the slot once no request holds or waits on it
+            self._host_users[key] -= 1
+            if not self._host_users[key]:
+                del self._host_users[key]
+                del self._host_slots[key]
+
+    @asynccontextmanager
+    async def handshake_slot(self) -> AsyncIterator[None]:
+        """Hold a WebSocket handshake slot for the duration of the block."""
+        async with self._handshake_slots:
+            yield
+
+    @asynccontextmanager
+    async def probe_slot(self) -> AsyncIterator[None]:
+        """Hold a discovery probe slot for the duration of the block."""
+        async with self._probe_slots:
+            yield
+
+
+@callback
+def async_get_transport(hass: HomeAssistant) -> ACITTransport:
+    """Return the transport shared by all ACIT config entries."""
+    transport: ACITTransport | None = hass.data.get(DATA_TRANSPORT)
+    if transport is None:
+        transport = hass.data[DATA_TRANSPORT] = ACITTransport(hass)
+    return transport
@@ -12,10 +12,10 @@ from homeassistant.components.update import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ACITThermACECCoordinator
+from .entity import ACITEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,9 +32,10 @@ async def async_setup_entry(
     async_add_entities([ACITUpdateEntity(coordinator, entry)])
 
 
-class ACITUpdateEntity(CoordinatorEntity, UpdateEntity):
+class ACITUpdateEntity(ACITEntity, UpdateEntity):
     """Update entity for ACIT ThermACEC - OTA management."""
 
+    _watched_keys = frozenset({"ota", "available"})
     _attr_device_class = UpdateDeviceClass.FIRMWARE
     _attr_supported_features = (
         UpdateEntityFeature.INSTALL
@@ -67,12 +68,11 @@ class ACITUpdateEntity(CoordinatorEntity, UpdateEntity):
     def installed_version(self) -> str | None:
         """Currently installed version."""
         version = self.coordinator.device_info.get("version")
-        _LOGGER.debug(f"Update entity - installed_version called, version = {version}")
-        _LOGGER.debug(f"Update entity - full device_info = {self.coordinator.device_info}")
 
-        # Return None if no valid version (Home Assistant will show "unknown")
+        # Return None if no valid version (Home Assistant will show "unknown").
+        # Read on every state write: the coordinator logs a missing version
+        # once when it receives the device configuration.
         if not version or version == "Unavailable":
-            _LOGGER.warning("No valid firmware version found in device_info")
             return None
 
         return version
@@ -80,8 +80,7 @@ class ACITUpdateEntity(CoordinatorEntity, UpdateEntity):
     @property
     def latest_version(self) -> str | None:
         """Latest available version."""
-        ota_data = self.coordinator.data.get("ota", {})
-        available_version = ota_data.get("available_version")
+        available_version = self.coordinator.data.ota.available_version
 
         # If no update is available, return the current version
         # so the entity state is "off" instead of "unknown"
@@ -93,30 +92,25 @@ class ACITUpdateEntity(CoordinatorEntity, UpdateEntity):
     @property
     def release_summary(self) -> str | None:
         """Release summary."""
-        ota_data = self.coordinator.data.get("ota", {})
-        if ota_data.get("update_available"):
-            channel = ota_data.get("channel", "stable")
-            return f"New version available on the {channel} channel"
+        ota = self.coordinator.data.ota
+        if ota.update_available:
+            return f"New version available on the {ota.channel} channel"
         return None
 
     @property
     def release_url(self) -> str | None:
         """URL to the full release notes."""
-        ota_data = self.coordinator.data.get("ota", {})
-        return ota_data.get("release_url")
+        return self.coordinator.data.ota.release_url
 
     @property
     def in_progress(self) -> bool | None:
         """Whether an update is in progress."""
-        ota_data = self.coordinator.data.get("ota", {})
-        state = ota_data.get("state", "idle")
-        return state in ["checking", "downloading", "applying"]
+        return self.coordinator.ota_in_progress
 
     @property
     def update_percentage(self) -> int | None:
         """Update progress (0-100%)."""
-        ota_data = self.coordinator.data.get("ota", {})
-        return ota_data.get("progress")
+        return self.coordinator.data.ota.progress
 
     async def async_install(
         self, version: str | None, backup: bool, **kwargs: Any
@@ -128,11 +122,9 @@ class ACITUpdateEntity(CoordinatorEntity, UpdateEntity):
         )
 
         try:
-            # Call the System.StartOTA RPC method
-            await self.coordinator.call_rpc("System.StartOTA", {})
-
-            # Refresh data to get the current state
-            await self.coordinator.async_request_refresh()
+            # Call the System.StartOTA RPC method, progress is then followed
+            # by the coordinator until the update completes
+            await self.coordinator.async_start_ota()
 
         except Exception as err:
             _LOGGER.error("Error starting OTA update: %s", err)
@@ -140,21 +132,20 @@ class ACITUpdateEntity(CoordinatorEntity, UpdateEntity):
 
     async def async_release_notes(self) -> str | None:
         """Return the full release notes."""
-        ota_data = self.coordinator.data.get("ota", {})
+        ota = self.coordinator.data.ota
 
         notes = []
         notes.append(f"## Version {self.latest_version}\n")
 
-        if channel := ota_data.get("channel"):
+        if channel := ota.channel:
             notes.append(f"**Channel:** {channel}\n")
 
-        if size := ota_data.get("size"):
+        if size := ota.size:
             size_mb = size / (1024 * 1024)
             notes.append(f"**Size:** {size_mb:.2f} MB\n")
 
-        if mandatory := ota_data.get("mandatory"):
-            if mandatory:
-                notes.append("⚠️ **Mandatory update**\n")
+        if ota.mandatory:
+            notes.append("⚠️ **Mandatory update**\n")
 
         notes.append("\n---\n")
         notes.append("The update will be downloaded and installed automatically.")
@@ -0,0 +1,274 @@
+"""Load test of the ACIT coordinators against simulated devices.
+
+Sets up N coordinators in a Home Assistant instance, each connected to its
+own simulated device, runs them for a while and reports:
+
+- setup time, overall and per device
+- messages per second exchanged with the devices, and state publishes
+- event loop lag, sampled by a periodic timer
+- memory per device
+
+    python scripts/load_test.py --devices 200 --duration 60 --notify-interval 1
+
+The simulated devices run in the same event loop by default, so the loop lag
+also includes their work. Start them in another process with
+scripts/simulator.py and pass --external HOST:BASE_PORT to measure the
+coordinators alone.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import MappingProxyType
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from simulator import (  # noqa: E402
+    SimulatedDevice,
+    add_config_arguments,
+    config_from_arguments,
+)
+
+from custom_components.acit.const import DOMAIN  # noqa: E402
+from custom_components.acit.coordinator import (  # noqa: E402
+    STATUS_FIELDS,
+    ACITThermACECCoordinator,
+)
+
+LAG_PROBE_INTERVAL = 0.05
+
+
+def _rss() -> int:
+    """Return the resident memory of the process in bytes."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            pages = int(statm.read().split()[1])
+    except OSError:
+        import resource
+
+        # Peak rather than current on platforms without /proc
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _message_counts(
+    coordinators: list[ACITThermACECCoordinator],
+) -> tuple[int, int, int]:
+    """Return the WebSocket messages, HTTP requests and RPC calls made so far."""
+    return (
+        sum(coordinator.telemetry.ws_messages for coordinator in coordinators),
+        sum(coordinator.telemetry.rpc_over_http for coordinator in coordinators),
+        sum(coordinator.telemetry.rpc_calls for coordinator in coordinators),
+    )
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return a percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class LoopLagProbe:
+    """Measure how late the event loop runs a periodic timer."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the probe."""
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        """Sleep for the interval and record the overshoot."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+
+def _make_entry(index: int, host: str, port: int) -> ConfigEntry:
+    """Return a config entry for a simulated device."""
+    return ConfigEntry(
+        version=2,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"Simulated {index}",
+        data={CONF_HOST: host, CONF_PORT: port, "device_name": f"Simulated {index}"},
+        discovery_keys=MappingProxyType({}),
+        options={},
+        source="user",
+        subentries_data=None,
+        unique_id=f"simulated-{index}",
+    )
+
+
+async def _async_setup_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry, durations: list[float]
+) -> ACITThermACECCoordinator | None:
+    """Set up a coordinator as the integration does, timing it."""
+    start = time.perf_counter()
+    coordinator = ACITThermACECCoordinator(hass, entry)
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        # Home Assistant would retry later, leave the device out
+        await coordinator.async_shutdown()
+        return None
+    durations.append(time.perf_counter() - start)
+
+    # Subscribe to the fields the climate entity would need
+    coordinator.async_require_fields(STATUS_FIELDS)
+    return coordinator
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    """Run the load test and print the report."""
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    devices: list[SimulatedDevice] = []
+    if args.external:
+        host, _, base_port = args.external.rpartition(":")
+        ports = [int(base_port) + index for index in range(args.devices)]
+    else:
+        host = "127.0.0.1"
+        config = config_from_arguments(args)
+        devices = [SimulatedDevice(index, config) for index in range(args.devices)]
+        await asyncio.gather(*(device.async_start(host) for device in devices))
+        ports = [device.port for device in devices]
+
+    config_dir = tempfile.mkdtemp(prefix="acit-load-test-")
+    hass = HomeAssistant(config_dir)
+
+    probe = LoopLagProbe(LAG_PROBE_INTERVAL)
+    probe.start()
+
+    # Setup
+    rss_before = _rss()
+    traced_before = tracemalloc.get_traced_memory()[0] if args.tracemalloc else 0
+    durations: list[float] = []
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            _async_setup_coordinator(hass, _make_entry(index, host, port), durations)
+            for index, port in enumerate(ports)
+        )
+    )
+    coordinators = [coordinator for coordinator in results if coordinator is not None]
+    setup_time = time.perf_counter() - start
+    setup_lag = list(probe.samples)
+
+    publishes = 0
+
+    def _count_publish() -> None:
+        nonlocal publishes
+        publishes += 1
+
+    for coordinator in coordinators:
+        coordinator.async_add_listener(_count_publish)
+
+    # Steady state
+    await asyncio.sleep(args.warmup)
+    probe.samples.clear()
+    publishes = 0
+    ws_before, http_before, rpc_before = _message_counts(coordinators)
+    start = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    elapsed = time.perf_counter() - start
+    ws_after, http_after, rpc_after = _message_counts(coordinators)
+    ws_count = ws_after - ws_before
+    http_count = http_after - http_before
+    rpc_count = rpc_after - rpc_before
+    run_lag = list(probe.samples)
+
+    rss_per_device = (_rss() - rss_before) / len(results)
+    traced_per_device = (
+        (tracemalloc.get_traced_memory()[0] - traced_before) / len(results)
+        if args.tracemalloc
+        else None
+    )
+    available = sum(1 for coordinator in coordinators if coordinator.data.available)
+
+    probe.stop()
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+    await hass.async_stop(force=True)
+    for device in devices:
+        await device.async_stop()
+
+    print(
+        f"Devices:               {len(coordinators)} set up "
+        f"({len(results) - len(coordinators)} failed, {available} available)"
+    )
+    print(
+        f"Setup:                 {setup_time:.2f} s total, "
+        f"p50 {_percentile(durations, 50) * 1000:.1f} ms, "
+        f"p95 {_percentile(durations, 95) * 1000:.1f} ms, "
+        f"max lag {max(setup_lag, default=0) * 1000:.1f} ms"
+    )
+    print(
+        f"Messages:              {(ws_count + http_count) / elapsed:.1f}/s "
+        f"({ws_count / elapsed:.1f} WebSocket/s, "
+        f"{http_count / elapsed:.1f} HTTP/s, "
+        f"{rpc_count / elapsed:.1f} RPC calls/s)"
+    )
+    print(f"State publishes:       {publishes / elapsed:.1f}/s")
+    print(
+        f"Event loop lag:        "
+        f"mean {statistics.fmean(run_lag or [0]) * 1000:.2f} ms, "
+        f"p99 {_percentile(run_lag, 99) * 1000:.2f} ms, "
+        f"max {max(run_lag, default=0) * 1000:.2f} ms"
+    )
+    memory = f"{rss_per_device / 1024:.1f} KiB RSS"
+    if traced_per_device is not None:
+        memory += f", {traced_per_device / 1024:.1f} KiB allocated"
+    if devices:
+        memory += " (simulators included)"
+    print(f"Memory per device:     {memory}")
+
+
+def main() -> None:
+    """Run the load test from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=100, help="Number of devices")
+    parser.add_argument("--duration", type=float, default=30, help="Measurement time (s)")
+    parser.add_argument("--warmup", type=float, default=5, help="Time before measuring (s)")
+    parser.add_argument(
+        "--external",
+        metavar="HOST:BASE_PORT",
+        help="Use devices started by scripts/simulator.py instead",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="Also trace Python allocations (slows everything down)",
+    )
+    add_config_arguments(parser)
+    asyncio.run(async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
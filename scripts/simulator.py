@@ -0,0 +1,362 @@
+"""Simulated ACIT devices for development and load testing.
+
+Each simulated device serves the JSON-RPC API on /rpc and notifications on
+/ws, like the firmware does:
+
+    python scripts/simulator.py --count 20 --base-port 8100 --notify-interval 1
+
+Then add a device in Home Assistant with host 127.0.0.1 and port 8100.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_FIELDS = ("temperature", "target_temperature", "heater_level", "fan_speed")
+
+
+@dataclass
+class SimulatorConfig:
+    """Behavior of a simulated device."""
+
+    # Delay added to every RPC answer (seconds), plus up to `jitter`
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Share of RPC requests and notifications lost on the way
+    drop_rate: float = 0.0
+    # Time between two NotifyStatus pushes (seconds), 0 disables them
+    notify_interval: float = 1.0
+    # Firmware capabilities
+    batch: bool = True
+    ws_rpc: bool = True
+    subscribe: bool = True
+    # Time taken by an OTA update (seconds)
+    ota_duration: float = 10.0
+    version: str = "2.1.0"
+    available_version: str = "2.2.0"
+
+
+@dataclass
+class _Client:
+    """WebSocket client of a simulated device."""
+
+    ws: web.WebSocketResponse
+    fields: tuple[str, ...] = STATUS_FIELDS
+    min_interval: float = 0.0
+    threshold: float = 0.0
+    last_sent: dict[str, Any] = field(default_factory=dict)
+
+
+class SimulatedDevice:
+    """An ACIT ThermACEC served by aiohttp."""
+
+    def __init__(self, index: int, config: SimulatorConfig) -> None:
+        """Initialize the device."""
+        self.index = index
+        self.config = config
+        self.mac_address = f"AA:C1:00:00:{index >> 8 & 0xFF:02X}:{index & 0xFF:02X}"
+        self.version = config.version
+        self.status: dict[str, Any] = {
+            "temperature": round(random.uniform(17, 21), 1),
+            "target_temperature": 21.0,
+            "heater_level": 0,
+            "fan_speed": 1,
+        }
+        self.ota: dict[str, Any] = {"state": "idle", "progress": None}
+
+        self.port = 0
+        self._runner: web.AppRunner | None = None
+        self._clients: list[_Client] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start serving, on a free port unless one is given."""
+        app = web.Application()
+        app.router.add_post("/rpc", self._handle_http)
+        app.router.add_get("/ws", self._handle_ws)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        for task in self._tasks:
+            task.cancel()
+        for client in list(self._clients):
+            await client.ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def _spawn(self, coro: Any) -> None:
+        """Run a task owned by the device."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _delay(self) -> bool:
+        """Wait for the simulated latency, returning False if the message is lost."""
+        delay = self.config.latency + random.uniform(0, self.config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        return random.random() >= self.config.drop_rate
+
+    # JSON-RPC
+
+    def _call(self, request: dict[str, Any], client: _Client | None = None) -> dict[str, Any]:
+        """Answer a JSON-RPC request."""
+        method = request.get("method")
+        params = request.get("params") or {}
+
+        if method == "Thermostat.GetConfig":
+            result: Any = {
+                "model": "ThermACEC",
+                "version": self.version,
+                "manufacturer": "ACIT",
+                "mac_address": self.mac_address,
+                "min_temp": 5,
+                "max_temp": 35,
+                "features": [],
+                "rated_power": 2000,
+            }
+        elif method == "Thermostat.GetStatus":
+            result = dict(self.status)
+        elif method == "Thermostat.SetTargetTemp":
+            self.status["target_temperature"] = float(params["temperature"])
+            self._spawn(self._async_notify_all())
+            result = {}
+        elif method == "System.CheckUpdate":
+            result = {
+                "update_available": self.version != self.config.available_version,
+                "version": self.config.available_version,
+                "channel": "stable",
+                "size": 1_048_576,
+                "mandatory": False,
+            }
+        elif method == "System.GetOTAStatus":
+            result = dict(self.ota)
+        elif method == "System.StartOTA":
+            self._spawn(self._async_run_ota())
+            result = {}
+        elif method == "System.Subscribe" and client is not None and self.config.subscribe:
+            client.fields = tuple(params.get("fields") or STATUS_FIELDS)
+            client.min_interval = float(params.get("min_interval") or 0)
+            client.threshold = float(params.get("threshold") or 0)
+            result = {}
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "error": {"code": -32601, "message": "Method not found"},
+            }
+
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    async def _handle_http(self, request: web.Request) -> web.StreamResponse:
+        """Handle a POST on /rpc."""
+        body = await request.json()
+        if not await self._delay():
+            # Never answer, the client times out
+            await asyncio.sleep(3600)
+
+        if isinstance(body, list):
+            if not self.config.batch:
+                return web.json_response(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": None,
+                        "error": {"code": -32600, "message": "Invalid Request"},
+                    }
+                )
+            return web.json_response([self._call(item) for item in body])
+
+        return web.json_response(self._call(body))
+
+    # WebSocket
+
+    async def _handle_ws(self, request: web.Request) -> web.StreamResponse:
+        """Handle a WebSocket client on /ws."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        client = _Client(ws)
+        self._clients.append(client)
+        pusher = asyncio.create_task(self._async_push(client))
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT or not self.config.ws_rpc:
+                    continue
+                message = json.loads(msg.data)
+                if isinstance(message, dict) and "id" in message:
+                    self._spawn(self._async_answer_ws(client, message))
+        finally:
+            pusher.cancel()
+            self._clients.remove(client)
+
+        return ws
+
+    async def _async_answer_ws(self, client: _Client, request: dict[str, Any]) -> None:
+        """Answer a JSON-RPC request received on the WebSocket."""
+        if await self._delay() and not client.ws.closed:
+            await client.ws.send_str(json.dumps(self._call(request, client)))
+
+    async def _async_push(self, client: _Client) -> None:
+        """Send NotifyStatus to a client at the configured interval."""
+        if not self.config.notify_interval:
+            return
+
+        while not client.ws.closed:
+            interval = max(self.config.notify_interval, client.min_interval)
+            await asyncio.sleep(interval * random.uniform(0.9, 1.1))
+            self._step()
+            await self._async_notify(client)
+
+    async def _async_notify_all(self) -> None:
+        """Send NotifyStatus to every client."""
+        for client in list(self._clients):
+            await self._async_notify(client)
+
+    async def _async_notify(self, client: _Client) -> None:
+        """Send the subscribed fields that changed to a client."""
+        params = {
+            key: self.status[key]
+            for key in client.fields
+            if key in self.status and self._changed(client, key)
+        }
+        if not params or random.random() < self.config.drop_rate or client.ws.closed:
+            return
+
+        client.last_sent.update(params)
+        await client.ws.send_str(
+            json.dumps({"jsonrpc": "2.0", "method": "NotifyStatus", "params": params})
+        )
+
+    def _changed(self, client: _Client, key: str) -> bool:
+        """Return whether a field moved enough to be sent to a client."""
+        previous = client.last_sent.get(key)
+        if previous is None:
+            return True
+        if key == "temperature":
+            delta = abs(self.status[key] - previous)
+            return delta > 0 and delta >= client.threshold
+        return self.status[key] != previous
+
+    def _step(self) -> None:
+        """Move the room temperature towards the setpoint."""
+        error = self.status["target_temperature"] - self.status["temperature"]
+        heater_level = max(0, min(100, round(error * 50)))
+        self.status["heater_level"] = heater_level
+        self.status["fan_speed"] = 0 if heater_level == 0 else 1 + heater_level // 40
+        self.status["temperature"] = round(
+            self.status["temperature"]
+            + heater_level / 2000
+            - 0.02
+            + random.uniform(-0.05, 0.05),
+            1,
+        )
+
+    # OTA
+
+    async def _async_run_ota(self) -> None:
+        """Download and apply the available firmware, pushing the progress."""
+        steps = 10
+        for step in range(steps + 1):
+            self.ota = {"state": "downloading", "progress": step * 100 // steps}
+            await self._async_notify_ota()
+            await asyncio.sleep(self.config.ota_duration / (steps + 2))
+
+        self.ota = {"state": "applying", "progress": 100}
+        await self._async_notify_ota()
+        await asyncio.sleep(self.config.ota_duration / (steps + 2))
+
+        # Reboot on the new firmware
+        self.version = self.config.available_version
+        self.ota = {"state": "idle", "progress": None}
+        for client in list(self._clients):
+            await client.ws.close()
+
+    async def _async_notify_ota(self) -> None:
+        """Send NotifyOTA to every client."""
+        message = json.dumps({"jsonrpc": "2.0", "method": "NotifyOTA", "params": self.ota})
+        for client in list(self._clients):
+            if not client.ws.closed:
+                await client.ws.send_str(message)
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the SimulatorConfig options to a command line parser."""
+    parser.add_argument("--latency", type=float, default=0.0, help="RPC latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency (s)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Share of lost messages")
+    parser.add_argument(
+        "--notify-interval", type=float, default=1.0, help="Time between pushes (s)"
+    )
+    parser.add_argument("--no-batch", action="store_true", help="Reject JSON-RPC batches")
+    parser.add_argument("--no-ws-rpc", action="store_true", help="Ignore RPC on /ws")
+    parser.add_argument(
+        "--no-subscribe", action="store_true", help="Reject System.Subscribe"
+    )
+
+
+def config_from_arguments(args: argparse.Namespace) -> SimulatorConfig:
+    """Build a SimulatorConfig from parsed command line options."""
+    return SimulatorConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        notify_interval=args.notify_interval,
+        batch=not args.no_batch,
+        ws_rpc=not args.no_ws_rpc,
+        subscribe=not args.no_subscribe,
+    )
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Serve simulated devices until interrupted."""
+    config = config_from_arguments(args)
+    devices = [SimulatedDevice(index, config) for index in range(args.count)]
+    for device in devices:
+        await device.async_start(args.host, args.base_port + device.index)
+    _LOGGER.info(
+        "Serving %d devices on %s:%d-%d",
+        len(devices),
+        args.host,
+        args.base_port,
+        args.base_port + len(devices) - 1,
+    )
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for device in devices:
+            await device.async_stop()
+
+
+def main() -> None:
+    """Run simulated devices from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1, help="Number of devices")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--base-port", type=int, default=8100, help="Port of the first device")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()